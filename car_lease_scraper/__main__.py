@@ -2,8 +2,7 @@
 Main entry point when the package is executed as a module.
 """
 
-import asyncio
-from car_lease_scraper.main import main
+from car_lease_scraper.main import run
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    run()
\ No newline at end of file
@@ -10,8 +10,8 @@ from pathlib import Path
 from typing import Dict, List, Optional, Union
 
 # Update the import to use pydantic-settings
-from pydantic_settings import BaseSettings
-from pydantic import HttpUrl, validator
+from pydantic_settings import BaseSettings, SettingsConfigDict
+from pydantic import HttpUrl, field_validator
 
 
 class Settings(BaseSettings):
@@ -21,18 +21,40 @@ class Settings(BaseSettings):
     Attributes:
         headless (bool): Whether to run browser in headless mode
         default_user_agent (str): Default user agent string
+        chromium_args (List[str]): Extra command line flags passed to Chromium on launch
+        chromium_single_process (bool): Whether to run Chromium as a single process; saves
+            memory on small containers but is unsupported and unstable with several pages
+        blocked_resource_types (List[str]): Resource types the browser does not download
         output_dir (Path): Directory for output files
-        default_format (str): Default output format (json or csv)
+        default_format (str): Default output format (json, csv, parquet or jsonl)
         max_retries (int): Maximum number of retries for failed requests
         request_delay (float): Delay between requests in seconds
         max_pages (int): Maximum number of pages to scrape per provider
+        max_concurrency (int): Maximum number of pages scraped concurrently per provider
+        max_parallel_providers (int): Maximum number of providers scraped concurrently
+        page_max_uses (int): Number of navigations after which a pooled page is recycled
         page_load_timeout (int): Timeout for page loading in milliseconds
+        debug (bool): Whether scrapers save screenshots and page HTML for troubleshooting
         log_level (str): Logging level
     """
     
     # Browser settings
     headless: bool = True
     default_user_agent: str = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/123.0.0.0 Safari/537.36"
+    chromium_args: List[str] = [
+        "--no-sandbox",
+        "--disable-dev-shm-usage",
+        "--disable-gpu",
+        "--disable-extensions",
+        "--disable-background-networking",
+        "--disable-sync",
+        "--disable-translate",
+        "--mute-audio",
+        "--no-first-run",
+        "--disable-features=IsolateOrigins,site-per-process",
+    ]
+    chromium_single_process: bool = False
+    blocked_resource_types: List[str] = ["image", "media", "font", "stylesheet", "other"]
     
     # Output settings
     output_dir: Path = Path("./data")
@@ -42,25 +64,32 @@ class Settings(BaseSettings):
     max_retries: int = 3
     request_delay: float = 2.0
     max_pages: int = 5
+    max_concurrency: int = 5
+    max_parallel_providers: int = 3
+    page_max_uses: int = 20
     page_load_timeout: int = 30000
     
     # Logging
+    debug: bool = False
     log_level: str = "INFO"
     
-    @validator("output_dir")
+    @field_validator("output_dir")
+    @classmethod
     def create_output_dir(cls, v):
         """Ensure output directory exists."""
         os.makedirs(v, exist_ok=True)
         return v
     
-    @validator("default_format")
+    @field_validator("default_format")
+    @classmethod
     def validate_format(cls, v):
         """Validate output format."""
-        if v.lower() not in ["json", "csv"]:
-            raise ValueError(f"Invalid format: {v}. Must be either 'json' or 'csv'")
+        if v.lower() not in ["json", "csv", "parquet", "jsonl"]:
+            raise ValueError(f"Invalid format: {v}. Must be one of 'json', 'csv', 'parquet' or 'jsonl'")
         return v.lower()
     
-    @validator("log_level")
+    @field_validator("log_level")
+    @classmethod
     def validate_log_level(cls, v):
         """Validate log level."""
         valid_levels = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
@@ -68,10 +97,7 @@ class Settings(BaseSettings):
             raise ValueError(f"Invalid log level: {v}. Must be one of {valid_levels}")
         return v.upper()
     
-    class Config:
-        """Pydantic configuration."""
-        env_file = ".env"
-        env_file_encoding = "utf-8"
+    model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf-8")
 
 
 # Create global settings instance
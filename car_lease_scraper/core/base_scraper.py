@@ -7,14 +7,29 @@ All provider-specific scrapers should extend this class.
 
 import abc
 import asyncio
+import functools
 import logging
-from typing import List, Optional, Dict, Any
+import os
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, TypeVar, Union
+from urllib.parse import urlsplit
 
 from playwright.async_api import Page, TimeoutError
 
 from car_lease_scraper.core.browser import BrowserManager
 from car_lease_scraper.models.lease_offer import LeaseOffer
 from car_lease_scraper.utils.logging import get_logger
+from car_lease_scraper.config import SETTINGS
+
+
+T = TypeVar("T")
+
+# Navigation limits shared by all scrapers, keyed by event loop and then by URL host.
+# Semaphores bind to the loop they are first awaited on, so each loop gets its own.
+_host_semaphores: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
 
 
 class BaseScraper(abc.ABC):
@@ -24,27 +39,54 @@ class BaseScraper(abc.ABC):
     Attributes:
         provider_name (str): Name of the leasing provider
         base_url (str): Base URL for the provider's website
+        content_ready_selector (str, optional): CSS selector that signals the offers have loaded
+        needs_human_delay (bool): Whether to pause randomly after each page load to pass bot checks
+        needs_scroll (bool): Whether pages must be scrolled like a human to load or pass bot checks
+        per_host_concurrency (int): Maximum number of concurrent navigations to one host
+        stagger_ms (int): Delay between the start of the first concurrent page workers in milliseconds
         logger (logging.Logger): Logger instance
     """
     
     provider_name: str = None
     base_url: str = None
+    content_ready_selector: Optional[str] = None
+    needs_human_delay: bool = False
+    needs_scroll: bool = False
+    per_host_concurrency: int = 3
+    stagger_ms: int = 100
     
-    def __init__(self, headless: bool = True, max_pages: int = 5):
+    def __init__(
+        self,
+        headless: bool = True,
+        max_pages: int = 5,
+        max_concurrency: Optional[int] = None,
+        debug: Optional[bool] = None,
+        output_dir: Optional[Union[str, Path]] = None
+    ):
         """
         Initialize the base scraper.
         
         Args:
             headless (bool): Whether to run the browser in headless mode
             max_pages (int): Maximum number of pages to scrape
+            max_concurrency (int, optional): Maximum number of pages scraped concurrently
+            debug (bool, optional): Whether to save screenshots and page HTML, defaults to the DEBUG setting
+            output_dir (str or Path, optional): Directory for output files, including debug snapshots
         """
         if not self.provider_name or not self.base_url:
             raise ValueError("provider_name and base_url must be defined in subclasses")
         
         self.headless = headless
         self.max_pages = max_pages
+        self.max_concurrency = max_concurrency or SETTINGS.max_concurrency
+        self.debug = SETTINGS.debug if debug is None else debug
+        self.output_dir = Path(output_dir) if output_dir else SETTINGS.output_dir
         self.logger = get_logger(f"{self.provider_name}_scraper")
         self.browser_manager = BrowserManager(headless=headless)
+        
+        # Parsing runs on worker threads so it doesn't stall in-flight page loads;
+        # the pool is created on first use and shut down on teardown
+        self._parse_executor: Optional[ThreadPoolExecutor] = None
     
     async def setup(self):
         """Set up resources needed for scraping."""
@@ -53,6 +95,57 @@ class BaseScraper(abc.ABC):
     async def teardown(self):
         """Clean up resources after scraping."""
         await self.browser_manager.teardown()
+        if self._parse_executor is not None:
+            self._parse_executor.shutdown(wait=False)
+            self._parse_executor = None
+    
+    async def run_in_parser(self, func: Callable[..., T], *args: Any) -> T:
+        """
+        Run CPU-bound parsing work on the parse thread pool.
+        
+        Args:
+            func (Callable): Function to run
+            *args: Arguments for the function
+            
+        Returns:
+            The function's return value
+        """
+        if self._parse_executor is None:
+            self._parse_executor = ThreadPoolExecutor(max_workers=os.cpu_count())
+        
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._parse_executor, functools.partial(func, *args))
+    
+    async def save_debug_snapshot(self, page: Page, name: str, html: bool = False):
+        """
+        Save a screenshot, and optionally the HTML, of a page when debugging is enabled.
+        
+        Files are written to a `debug` folder in the output directory. Does
+        nothing unless the scraper runs in debug mode.
+        
+        Args:
+            page (Page): Playwright page object
+            name (str): Name for the saved files, without extension
+            html (bool): Whether to also save the page HTML
+        """
+        if not self.debug:
+            return
+        
+        debug_dir = self.output_dir / "debug"
+        debug_dir.mkdir(parents=True, exist_ok=True)
+        stem = debug_dir / f"{self.provider_name}_{name}"
+        
+        try:
+            await page.screenshot(path=f"{stem}.png")
+            if html:
+                content = await page.content()
+                # Write from a worker thread so the event loop isn't blocked on disk
+                loop = asyncio.get_running_loop()
+                await loop.run_in_executor(
+                    None, functools.partial(Path(f"{stem}.html").write_text, content, encoding="utf-8")
+                )
+        except Exception as e:
+            self.logger.debug(f"Could not save debug snapshot {name}: {str(e)}")
     
     async def __aenter__(self):
         """Context manager entry."""
@@ -64,47 +157,138 @@ class BaseScraper(abc.ABC):
         await self.teardown()
     
     @abc.abstractmethod
-    async def extract_offers(self, page: Page) -> List[LeaseOffer]:
+    async def extract_offers(self, page: Page, scraped_at: datetime) -> List[LeaseOffer]:
         """
         Extract lease offers from a page.
         
         Args:
             page (Page): Playwright page object
+            scraped_at (datetime): Start time of the scrape, used as every offer's timestamp
             
         Returns:
             List[LeaseOffer]: List of extracted lease offers
         """
         pass
     
-    async def navigate_to_page(self, url: str) -> Page:
+    async def navigate_to_page(self, url: str, page: Optional[Page] = None) -> Page:
         """
         Navigate to a specific URL.
         
+        Navigations to the same host are limited to `per_host_concurrency` at
+        a time, so parallel scraping doesn't hit a provider with a burst of requests.
+        
         Args:
             url (str): URL to navigate to
+            page (Page, optional): Page to navigate; a pooled page is used if omitted
             
         Returns:
             Page: Playwright page object
         """
-        return await self.browser_manager.navigate_to_page(url)
+        host = urlsplit(url).netloc
+        loop_semaphores = _host_semaphores.setdefault(asyncio.get_running_loop(), {})
+        semaphore = loop_semaphores.get(host)
+        if semaphore is None:
+            semaphore = loop_semaphores[host] = asyncio.Semaphore(self.per_host_concurrency)
+        
+        async with semaphore:
+            return await self.browser_manager.navigate_to_page(
+                url,
+                page=page,
+                wait_selector=self.content_ready_selector,
+                human_delay=self.needs_human_delay,
+                scroll=self.needs_scroll
+            )
     
-    async def scrape(self) -> List[LeaseOffer]:
+    def page_urls(self) -> List[str]:
         """
-        Main method to scrape lease offers.
+        Get the result page URLs that can be scraped independently.
+        
+        Providers whose pagination is addressable by URL should override this
+        so the pages can be fetched concurrently. The default only returns the
+        base URL; further pages are then reached via `go_to_next_page`.
         
         Returns:
-            List[LeaseOffer]: List of all extracted lease offers
+            List[str]: URLs of the result pages
+        """
+        return [self.base_url]
+    
+    async def scrape(self) -> AsyncIterator[LeaseOffer]:
+        """
+        Main method to scrape lease offers.
+        
+        Offers are yielded as soon as their result page has been extracted,
+        in page order. URL-addressable result pages are scraped concurrently,
+        bounded by `max_concurrency`.
+        
+        Yields:
+            LeaseOffer: Extracted lease offers
         """
         self.logger.info(f"Starting to scrape {self.provider_name} at {self.base_url}")
         
-        page = await self.navigate_to_page(self.base_url)
-        all_offers = []
+        # All offers from one scrape share its start time
+        scraped_at = datetime.now(timezone.utc)
+        urls = self.page_urls()[:self.max_pages]
+        total = 0
         
-        try:
-            # Extract offers from the first page
-            offers = await self.extract_offers(page)
-            all_offers.extend(offers)
-            self.logger.info(f"Extracted {len(offers)} offers from page 1")
+        if len(urls) == 1:
+            # Click-through pagination is sequential, so stream straight from the page
+            async for offer in self._scrape_one(urls[0], scraped_at, follow_pagination=True):
+                total += 1
+                yield offer
+        else:
+            semaphore = asyncio.Semaphore(self.max_concurrency)
+            
+            async def scrape_bounded(url: str, worker_id: int) -> List[LeaseOffer]:
+                async with semaphore:
+                    # Stagger the first wave of workers `stagger_ms` apart; later pages
+                    # start as slots free up, so they are already spread out
+                    if worker_id < self.max_concurrency:
+                        await asyncio.sleep(worker_id * self.stagger_ms / 1000)
+                    return [offer async for offer in self._scrape_one(url, scraped_at)]
+            
+            tasks = [
+                asyncio.ensure_future(scrape_bounded(url, worker_id))
+                for worker_id, url in enumerate(urls)
+            ]
+            try:
+                # Await pages in order while later pages keep loading in the background
+                for task in tasks:
+                    for offer in await task:
+                        total += 1
+                        yield offer
+            finally:
+                for task in tasks:
+                    task.cancel()
+        
+        self.logger.info(f"Completed scraping {self.provider_name}. Total offers: {total}")
+    
+    async def _scrape_one(
+        self,
+        url: str,
+        scraped_at: datetime,
+        follow_pagination: bool = False
+    ) -> AsyncIterator[LeaseOffer]:
+        """
+        Scrape the offers from a single result page on its own browser page.
+        
+        Args:
+            url (str): URL of the result page
+            scraped_at (datetime): Start time of the scrape
+            follow_pagination (bool): Whether to follow next page links from this page
+            
+        Yields:
+            LeaseOffer: Offers extracted from the page
+        """
+        async with self.browser_manager.page() as page:
+            await self.navigate_to_page(url, page=page)
+            
+            offers = await self.extract_offers(page, scraped_at)
+            self.logger.info(f"Extracted {len(offers)} offers from {url}")
+            for offer in offers:
+                yield offer
+            
+            if not follow_pagination:
+                return
             
             # Handle pagination if implemented by the subclass
             page_num = 1
@@ -114,15 +298,10 @@ class BaseScraper(abc.ABC):
                 
                 await self.go_to_next_page(page)
                 
-                offers = await self.extract_offers(page)
-                all_offers.extend(offers)
+                offers = await self.extract_offers(page, scraped_at)
                 self.logger.info(f"Extracted {len(offers)} offers from page {page_num}")
-            
-            self.logger.info(f"Completed scraping {self.provider_name}. Total offers: {len(all_offers)}")
-            return all_offers
-            
-        finally:
-            await page.close()
+                for offer in offers:
+                    yield offer
     
     async def has_next_page(self, page: Page) -> bool:
         """
@@ -1,24 +1,82 @@
 """
 Browser Management Module
 
-Provides a browser manager class for handling browser instances and page navigation.
+Provides a browser manager class for handling browser contexts and page navigation.
+A single Chromium instance is shared by all browser managers in the process.
 """
 
 import asyncio
 import random
-from typing import Optional
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, Optional
 
-from playwright.async_api import async_playwright, Browser, BrowserContext, Page, TimeoutError
-from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
+from playwright.async_api import async_playwright, Browser, BrowserContext, Page, Route, TimeoutError
 
 from car_lease_scraper.utils.logging import get_logger
 from car_lease_scraper.utils.anti_bot import add_stealth_scripts
 from car_lease_scraper.config import SETTINGS
 
 
+logger = get_logger("browser")
+
+# Process-wide Playwright driver and browsers, keyed by headless mode
+_playwright = None
+_shared_browsers: Dict[bool, Browser] = {}
+_shared_lock: Optional[asyncio.Lock] = None
+
+
+async def get_shared_browser(headless: bool = True) -> Browser:
+    """
+    Get the browser shared by all scrapers, launching it on first use.
+    
+    Args:
+        headless (bool): Whether to run browser in headless mode
+        
+    Returns:
+        Browser: Playwright browser object
+    """
+    global _playwright, _shared_lock
+    
+    if _shared_lock is None:
+        _shared_lock = asyncio.Lock()
+    
+    async with _shared_lock:
+        browser = _shared_browsers.get(headless)
+        if browser is None or not browser.is_connected():
+            logger.info("Launching shared browser")
+            if _playwright is None:
+                _playwright = await async_playwright().start()
+            args = list(SETTINGS.chromium_args)
+            if SETTINGS.chromium_single_process:
+                args.append("--single-process")
+            browser = await _playwright.chromium.launch(
+                headless=headless,
+                args=args,
+                chromium_sandbox=False,
+            )
+            _shared_browsers[headless] = browser
+        return browser
+
+
+async def close_shared_browsers():
+    """Close the shared browsers and stop Playwright. Call once at shutdown."""
+    global _playwright, _shared_lock
+    
+    for browser in _shared_browsers.values():
+        await browser.close()
+    _shared_browsers.clear()
+    
+    if _playwright:
+        await _playwright.stop()
+        _playwright = None
+    
+    # The lock is bound to this event loop; a later asyncio.run needs a new one
+    _shared_lock = None
+
+
 class BrowserManager:
     """
-    Manages browser instances and provides navigation utilities.
+    Manages a browser context on the shared browser and provides navigation utilities.
     
     Attributes:
         headless (bool): Whether to run browser in headless mode
@@ -44,89 +102,233 @@ class BrowserManager:
         self.headless = headless
         self.user_agent = user_agent or SETTINGS.default_user_agent
         self.viewport = viewport or {"width": 1920, "height": 1080}
+        self.blocked_resource_types = frozenset(SETTINGS.blocked_resource_types)
         self.logger = get_logger("browser")
         
-        self.playwright = None
         self.browser: Optional[Browser] = None
         self.context: Optional[BrowserContext] = None
+        
+        # Idle pages ready for reuse, and how many navigations each page has served
+        self._page_pool: Optional[asyncio.Queue] = None
+        self._page_uses: Dict[Page, int] = {}
     
     async def setup(self):
-        """Set up browser and context."""
-        self.logger.info("Setting up browser")
-        self.playwright = await async_playwright().start()
-        self.browser = await self.playwright.chromium.launch(headless=self.headless)
-        self.context = await self.browser.new_context(
+        """Set up a browser context on the shared browser."""
+        self.logger.info("Setting up browser context")
+        self.browser = await get_shared_browser(self.headless)
+        self.context = await self.new_context()
+        self._page_pool = asyncio.Queue(maxsize=SETTINGS.max_concurrency)
+    
+    async def teardown(self):
+        """Clean up the browser context; the shared browser stays running."""
+        self.logger.info("Cleaning up browser resources")
+        if self._page_pool:
+            while not self._page_pool.empty():
+                await self._close_page(self._page_pool.get_nowait())
+        if self.context:
+            await self.context.close()
+    
+    async def new_context(self) -> BrowserContext:
+        """
+        Create an isolated browser context with stealth and resource blocking.
+        
+        Returns:
+            BrowserContext: Playwright browser context
+        """
+        context = await self.browser.new_context(
             user_agent=self.user_agent,
             viewport=self.viewport,
         )
         
         # Add stealth scripts to evade bot detection
-        await add_stealth_scripts(self.context)
+        await add_stealth_scripts(context)
+        
+        # Skip downloading resources that are not needed for data extraction
+        if self.blocked_resource_types:
+            await context.route("**/*", self._route_filter)
+        
+        return context
     
-    async def teardown(self):
-        """Clean up browser resources."""
-        self.logger.info("Cleaning up browser resources")
-        if self.context:
-            await self.context.close()
-        if self.browser:
-            await self.browser.close()
-        if self.playwright:
-            await self.playwright.stop()  # Use this instead of __aexit__
-    
-    @retry(
-        stop=stop_after_attempt(SETTINGS.max_retries),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        retry=retry_if_exception_type(TimeoutError)
-    )
-    async def navigate_to_page(self, url: str) -> Page:
+    async def acquire_page(self) -> Page:
+        """
+        Get a page from the pool, creating a new one if none is idle.
+        
+        Returns:
+            Page: Playwright page object
+        """
+        try:
+            page = self._page_pool.get_nowait()
+        except asyncio.QueueEmpty:
+            page = await self.context.new_page()
+            self._page_uses[page] = 0
+        return page
+    
+    async def release_page(self, page: Page):
+        """
+        Return a page to the pool.
+        
+        Pages are closed instead of pooled when they have served
+        `SETTINGS.page_max_uses` navigations or when the pool is full.
+        
+        Args:
+            page (Page): Playwright page object
+        """
+        self._page_uses[page] = self._page_uses.get(page, 0) + 1
+        
+        if page.is_closed() or self._page_uses[page] >= SETTINGS.page_max_uses or self._page_pool.full():
+            await self._close_page(page)
+            return
+        
+        try:
+            await page.goto("about:blank")
+        except Exception:
+            await self._close_page(page)
+            return
+        
+        self._page_pool.put_nowait(page)
+    
+    @asynccontextmanager
+    async def page(self) -> AsyncIterator[Page]:
+        """
+        Borrow a pooled page for the duration of a block.
+        
+        Yields:
+            Page: Playwright page object
+        """
+        page = await self.acquire_page()
+        try:
+            yield page
+        finally:
+            await self.release_page(page)
+    
+    async def _close_page(self, page: Page):
+        """
+        Close a page and stop tracking it.
+        
+        Args:
+            page (Page): Playwright page object
+        """
+        self._page_uses.pop(page, None)
+        if not page.is_closed():
+            await page.close()
+    
+    async def navigate_to_page(
+        self,
+        url: str,
+        page: Optional[Page] = None,
+        wait_selector: Optional[str] = None,
+        human_delay: bool = False,
+        scroll: bool = False
+    ) -> Page:
         """
         Navigate to a URL with retry logic.
         
         Args:
             url (str): URL to navigate to
+            page (Page, optional): Page to navigate; acquired from the pool if omitted
+            wait_selector (str, optional): CSS selector to wait for before returning
+            human_delay (bool): Whether to pause for a random 1-3 seconds after loading
+            scroll (bool): Whether to scroll through the page like a human would
             
         Returns:
             Page: Playwright page object
         """
         self.logger.info(f"Navigating to {url}")
-        page = await self.context.new_page()
+        owns_page = page is None
+        if owns_page:
+            page = await self.acquire_page()
         
         try:
-            response = await page.goto(
-                url, 
-                wait_until="networkidle", 
-                timeout=SETTINGS.page_load_timeout
-            )
-            
-            if not response or response.status >= 400:
-                self.logger.error(f"Failed to load page: {response.status if response else 'No response'}")
-                raise TimeoutError(f"Failed to load page: {url}")
+            # Retry timeouts with jittered exponential backoff (2s, 4s, 8s, ... capped at 10s)
+            attempts = max(1, SETTINGS.max_retries)
+            for attempt in range(1, attempts + 1):
+                try:
+                    await self._load(page, url, wait_selector)
+                    break
+                except TimeoutError:
+                    if attempt == attempts:
+                        raise
+                    delay = min(10, 2 ** attempt + random.random())
+                    self.logger.warning(f"Loading {url} timed out, retrying in {delay:.1f}s")
+                    await asyncio.sleep(delay)
             
             # Add random delay to mimic human behavior
-            await asyncio.sleep(random.uniform(1, 3))
+            if human_delay:
+                await asyncio.sleep(1 + 2 * random.random())
             
             # Perform random scrolling
-            await self._random_scroll(page)
+            if scroll:
+                await self._random_scroll(page)
             
             return page
         except Exception as e:
-            await page.close()
+            if owns_page:
+                await self.release_page(page)
             raise e
     
-    async def _random_scroll(self, page: Page):
+    async def _load(self, page: Page, url: str, wait_selector: Optional[str] = None):
         """
-        Perform random scrolling to mimic human behavior.
+        Load a URL in a page and wait for its content.
         
         Args:
             page (Page): Playwright page object
+            url (str): URL to load
+            wait_selector (str, optional): CSS selector to wait for
+            
+        Raises:
+            TimeoutError: If the page or the selector does not load in time
+        """
+        response = await page.goto(
+            url, 
+            wait_until="domcontentloaded", 
+            timeout=SETTINGS.page_load_timeout
+        )
+        
+        if not response or response.status >= 400:
+            self.logger.error(f"Failed to load page: {response.status if response else 'No response'}")
+            raise TimeoutError(f"Failed to load page: {url}")
+        
+        # Wait for the content we need rather than for the whole page to settle
+        if wait_selector:
+            await page.wait_for_selector(
+                wait_selector,
+                state="attached",
+                timeout=SETTINGS.page_load_timeout
+            )
+    
+    async def _route_filter(self, route: Route):
         """
-        # Get page height
-        page_height = await page.evaluate("document.body.scrollHeight")
+        Abort requests for blocked resource types and let the rest through.
         
-        # Scroll in chunks with small pauses
-        scroll_chunks = min(5, max(2, page_height // 1000))
-        chunk_size = page_height / scroll_chunks
+        Args:
+            route (Route): Playwright route for the intercepted request
+        """
+        if route.request.resource_type in self.blocked_resource_types:
+            await route.abort()
+        else:
+            await route.continue_()
+    
+    async def _random_scroll(self, page: Page):
+        """
+        Perform random scrolling to mimic human behavior.
+        
+        The whole scroll sequence runs inside the page in a single evaluate call.
         
-        for i in range(1, scroll_chunks + 1):
-            await page.evaluate(f"window.scrollTo(0, {i * chunk_size})")
-            await asyncio.sleep(0.5 + (0.5 * (i / scroll_chunks)))  # Gradually slow down scrolling
\ No newline at end of file
+        Args:
+            page (Page): Playwright page object
+        """
+        await page.evaluate("""
+            async () => {
+                const pageHeight = document.body.scrollHeight;
+                
+                // Scroll in chunks with small pauses
+                const scrollChunks = Math.min(5, Math.max(2, Math.floor(pageHeight / 1000)));
+                const chunkSize = pageHeight / scrollChunks;
+                
+                for (let i = 1; i <= scrollChunks; i++) {
+                    window.scrollTo(0, i * chunkSize);
+                    // Gradually slow down scrolling
+                    await new Promise(resolve => setTimeout(resolve, 500 + 500 * (i / scrollChunks)));
+                }
+            }
+        """)
\ No newline at end of file
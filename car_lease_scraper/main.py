@@ -6,14 +6,16 @@ Provides the main entry point for the car lease scraper application.
 
 import argparse
 import asyncio
+import importlib.util
 import sys
+from contextlib import nullcontext
 from datetime import datetime
 from pathlib import Path
 from typing import List, Optional
 
 from rich.console import Console
-from rich.table import Table
 
+from car_lease_scraper.core.browser import close_shared_browsers
 from car_lease_scraper.scrapers.registry import registry
 from car_lease_scraper.pipeline.processor import DataProcessor
 from car_lease_scraper.utils.logging import setup_root_logger, get_logger
@@ -30,17 +32,19 @@ async def run_scraper(
     output_formats: List[str],
     output_dir: Optional[Path] = None,
     headless: bool = True,
-    max_pages: int = 5
+    max_pages: int = 5,
+    debug: bool = False
 ) -> bool:
     """
     Run a scraper for a specific provider.
     
     Args:
         provider_name (str): Name of the provider to scrape
-        output_formats (List[str]): List of output formats (json, csv)
+        output_formats (List[str]): List of output formats (json, csv, parquet, jsonl)
         output_dir (Path, optional): Directory for output files
         headless (bool): Whether to run browser in headless mode
         max_pages (int): Maximum number of pages to scrape
+        debug (bool): Whether to save screenshots and page HTML for troubleshooting
         
     Returns:
         bool: Whether the scraping was successful
@@ -50,7 +54,7 @@ async def run_scraper(
         scraper_class = registry.get_scraper(provider_name)
         
         # Create scraper instance
-        scraper = scraper_class(headless=headless, max_pages=max_pages)
+        scraper = scraper_class(headless=headless, max_pages=max_pages, debug=debug, output_dir=output_dir)
         
         # Create processor
         processor = DataProcessor(output_dir=output_dir)
@@ -61,38 +65,67 @@ async def run_scraper(
         
         start_time = datetime.now()
         
+        # Prefix files with the provider so providers scraped concurrently
+        # don't overwrite each other's files
+        file_stem = f"{provider_name}_lease_offers_{start_time.strftime('%Y%m%d_%H%M%S')}"
+        output_formats = [output_format.lower() for output_format in output_formats]
+        
+        # JSON Lines output is streamed; the other formats need the full result set
+        stream_jsonl = 'jsonl' in output_formats
+        keep_offers = any(output_format in ('json', 'csv', 'parquet') for output_format in output_formats)
+        jsonl_writer = processor.open_jsonl_writer(f"{file_stem}.jsonl") if stream_jsonl else nullcontext()
+        
         # Run the scraper
         async with scraper:
-            # Extract data
-            offers = await scraper.scrape()
+            offers = []
+            offer_count = 0
             
-            if not offers:
+            with jsonl_writer:
+                async for offer in scraper.scrape():
+                    offer_count += 1
+                    if stream_jsonl:
+                        jsonl_writer.write(offer)
+                    # Keep only a sample for the summary when nothing needs the full set
+                    if keep_offers or len(offers) < 5:
+                        offers.append(offer)
+            
+            if not offer_count:
                 console.print("[bold yellow]No offers found[/bold yellow]")
                 return False
             
-            # Process data
-            processed_data = processor.process(offers)
+            if stream_jsonl:
+                console.print(f"Saved JSON Lines data to: [blue]{jsonl_writer.filepath}[/blue]")
             
-            # Save data in requested formats
-            for output_format in output_formats:
-                if output_format.lower() == 'json':
-                    filepath = processed_data.save_to_json()
-                    console.print(f"Saved JSON data to: [blue]{filepath}[/blue]")
+            if keep_offers:
+                # Process data
+                processed_data = processor.process(offers)
                 
-                elif output_format.lower() == 'csv':
-                    filepath = processed_data.save_to_csv()
-                    console.print(f"Saved CSV data to: [blue]{filepath}[/blue]")
+                # Save data in requested formats
+                for output_format in output_formats:
+                    if output_format == 'json':
+                        filepath = processed_data.save_to_json(f"{file_stem}.json")
+                        console.print(f"Saved JSON data to: [blue]{filepath}[/blue]")
+                    
+                    elif output_format == 'csv':
+                        filepath = processed_data.save_to_csv(f"{file_stem}.csv")
+                        console.print(f"Saved CSV data to: [blue]{filepath}[/blue]")
+                    
+                    elif output_format == 'parquet':
+                        filepath = processed_data.save_to_parquet(f"{file_stem}.parquet")
+                        console.print(f"Saved Parquet data to: [blue]{filepath}[/blue]")
             
             # Print summary
             end_time = datetime.now()
             duration = (end_time - start_time).total_seconds()
             
             console.print("\n[bold]Scraping Summary:[/bold]")
-            console.print(f"Total offers: [green]{len(processed_data)}[/green]")
+            console.print(f"Total offers: [green]{offer_count}[/green]")
             console.print(f"Duration: [green]{duration:.2f} seconds[/green]")
             
             # Show sample of scraped data
             if offers:
+                from rich.table import Table
+                
                 table = Table(title="Sample of Scraped Data")
                 table.add_column("Make/Model", style="cyan")
                 table.add_column("Version", style="magenta")
@@ -131,6 +164,9 @@ def list_providers():
         console.print("[yellow]No providers registered[/yellow]")
         return
     
+    # Imported here so the CLI only loads table rendering when it prints one
+    from rich.table import Table
+    
     table = Table(title="Available Providers")
     table.add_column("Name", style="cyan")
     table.add_column("Scraper", style="green")
@@ -146,6 +182,32 @@ def list_providers():
     console.print(table)
 
 
+def print_run_summary(providers: List[str], results: List[object]):
+    """
+    Print the outcome of each provider run in a single table.
+    
+    Args:
+        providers (List[str]): Names of the providers that were scraped
+        results (List[object]): Result of each run, or the exception it raised
+    """
+    from rich.table import Table
+    
+    table = Table(title="Providers Summary")
+    table.add_column("Provider", style="cyan")
+    table.add_column("Status")
+    
+    for provider_name, result in zip(providers, results):
+        if isinstance(result, BaseException):
+            status = f"[red]Error: {result}[/red]"
+        elif result:
+            status = "[green]OK[/green]"
+        else:
+            status = "[yellow]Failed[/yellow]"
+        table.add_row(provider_name, status)
+    
+    console.print(table)
+
+
 async def main():
     """Main entry point function."""
     # Set up logging
@@ -158,7 +220,7 @@ async def main():
     parser = argparse.ArgumentParser(description="Car Lease Scraper")
     parser.add_argument(
         "--provider", "-p",
-        help="Provider to scrape (use --list to see available providers)"
+        help="Provider(s) to scrape, comma-separated (use --list to see available providers)"
     )
     parser.add_argument(
         "--list", "-l", 
@@ -168,7 +230,7 @@ async def main():
     parser.add_argument(
         "--output-format", "-f",
         default="json",
-        help="Output format(s), comma-separated (json,csv)"
+        help="Output format(s), comma-separated (json,csv,parquet,jsonl)"
     )
     parser.add_argument(
         "--output-dir", "-o",
@@ -187,6 +249,12 @@ async def main():
         default=SETTINGS.max_pages,
         help="Maximum number of pages to scrape"
     )
+    parser.add_argument(
+        "--debug",
+        action="store_true",
+        default=SETTINGS.debug,
+        help="Save screenshots and page HTML to the output directory for troubleshooting"
+    )
     
     args = parser.parse_args()
     
@@ -200,19 +268,58 @@ async def main():
         parser.print_help()
         return
     
-    # Run scraper
+    # Run scrapers, each provider in its own context on a shared browser
     output_formats = [fmt.strip() for fmt in args.output_format.split(",")]
-    success = await run_scraper(
-        provider_name=args.provider,
-        output_formats=output_formats,
-        output_dir=Path(args.output_dir),
-        headless=args.headless,
-        max_pages=args.max_pages
-    )
+    
+    # Fail before scraping, not after, when an output format can't be written
+    if "parquet" in (fmt.lower() for fmt in output_formats) and importlib.util.find_spec("pyarrow") is None:
+        console.print(
+            "[bold red]Parquet output requires pyarrow. "
+            "Install the parquet extra: pip install 'car-lease-scraper\\[parquet]'[/bold red]"
+        )
+        sys.exit(1)
+    
+    providers = [name.strip() for name in args.provider.split(",") if name.strip()]
+    semaphore = asyncio.Semaphore(SETTINGS.max_parallel_providers)
+    
+    async def run_bounded(provider_name: str) -> bool:
+        async with semaphore:
+            return await run_scraper(
+                provider_name=provider_name,
+                output_formats=output_formats,
+                output_dir=Path(args.output_dir),
+                headless=args.headless,
+                max_pages=args.max_pages,
+                debug=args.debug
+            )
+    
+    try:
+        results = await asyncio.gather(
+            *(run_bounded(provider_name) for provider_name in providers),
+            return_exceptions=True
+        )
+    finally:
+        await close_shared_browsers()
+    successes = [result is True for result in results]
+    
+    if len(providers) > 1:
+        print_run_summary(providers, results)
     
     # Exit with appropriate code
-    sys.exit(0 if success else 1)
+    sys.exit(0 if all(successes) else 1)
+
+
+def run():
+    """Run the CLI, using uvloop as the event loop when it is installed."""
+    try:
+        import uvloop
+    except ImportError:  # uvloop is optional and POSIX-only
+        pass
+    else:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    
+    asyncio.run(main())
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    run()
\ No newline at end of file
@@ -7,13 +7,15 @@ Defines the data model for car lease offers.
 from datetime import datetime
 from typing import List, Optional, Dict, Any
 
-from pydantic import BaseModel, Field, validator, HttpUrl
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, field_validator, HttpUrl
 
 
 class LeaseOffer(BaseModel):
     """
     Model representing a car lease offer.
     
+    Offers are immutable once scraped.
+    
     Attributes:
         car_make (str): Car manufacturer
         car_model (str): Car model name
@@ -24,7 +26,7 @@ class LeaseOffer(BaseModel):
         delivery_time (str, optional): Estimated delivery time
         promotional_tags (List[str]): List of promotional tags or special offers
         image_url (HttpUrl, optional): URL to the car image
-        scrape_timestamp (datetime): When the data was scraped
+        scrape_timestamp (datetime): When the scrape that produced the offer started (UTC)
         source_url (HttpUrl): URL of the source page
         provider (str): Name of the leasing provider
         raw_data (Dict, optional): Raw data from the scraper
@@ -39,25 +41,23 @@ class LeaseOffer(BaseModel):
     delivery_time: Optional[str] = None
     promotional_tags: List[str] = Field(default_factory=list)
     image_url: Optional[HttpUrl] = None
-    scrape_timestamp: datetime = Field(default_factory=datetime.now)
+    scrape_timestamp: datetime
     source_url: HttpUrl
     provider: str
     raw_data: Optional[Dict[str, Any]] = None
     
-    class Config:
-        """Pydantic configuration."""
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
+    model_config = ConfigDict(frozen=True, extra="ignore")
     
-    @validator('monthly_price')
+    @field_validator('monthly_price')
+    @classmethod
     def validate_price(cls, v):
         """Ensure price is positive."""
         if v <= 0:
             raise ValueError("Price must be positive")
         return v
     
-    @validator('kilometers_per_year')
+    @field_validator('kilometers_per_year')
+    @classmethod
     def validate_kilometers(cls, v):
         """Validate kilometers per year is within reasonable range."""
         if v <= 0:
@@ -66,7 +66,8 @@ class LeaseOffer(BaseModel):
             raise ValueError("Kilometers per year seems unreasonably high")
         return v
     
-    @validator('lease_term_months')
+    @field_validator('lease_term_months')
+    @classmethod
     def validate_lease_term(cls, v):
         """Validate lease term is within reasonable range."""
         if v <= 0:
@@ -82,7 +83,11 @@ class LeaseOffer(BaseModel):
         Returns:
             Dict[str, Any]: Dictionary representation
         """
-        result = self.dict(exclude={'raw_data'})
+        # JSON mode serializes datetimes and URLs to strings in one pass
+        result = self.model_dump(mode="json", exclude={'raw_data'})
         result['promotional_tags'] = ','.join(self.promotional_tags)
-        result['scrape_timestamp'] = self.scrape_timestamp.isoformat()
-        return result
\ No newline at end of file
+        return result
+
+
+# Validates a whole list of offer dicts in a single pydantic-core call
+LEASE_OFFERS_ADAPTER = TypeAdapter(List[LeaseOffer])
\ No newline at end of file
@@ -4,18 +4,25 @@ Data Processor Module
 Handles the processing pipeline for scraped data.
 """
 
+import csv
 import json
 import os
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Union
-
-import pandas as pd
+from typing import TYPE_CHECKING, List, Dict, Any, Optional, Union
 
 from car_lease_scraper.models.lease_offer import LeaseOffer
 from car_lease_scraper.utils.logging import get_logger
 from car_lease_scraper.config import SETTINGS
 
+try:
+    import orjson
+except ImportError:  # Optional speedup, fall back to the stdlib json module
+    orjson = None
+
+if TYPE_CHECKING:
+    import pandas as pd
+
 
 logger = get_logger("data_processor")
 
@@ -50,59 +57,72 @@ class DataProcessor:
         """
         logger.info(f"Processing {len(offers)} lease offers")
         
-        # Validate offers
-        valid_offers = self._validate_offers(offers)
-        logger.info(f"{len(valid_offers)}/{len(offers)} offers passed validation")
-        
-        # Transform data
-        transformed_offers = self._transform_offers(valid_offers)
-        
-        # Create processed data object
+        # Offers are validated by Pydantic when they are constructed
         return ProcessedData(
-            offers=transformed_offers,
+            offers=offers,
             output_dir=self.output_dir
         )
     
-    def _validate_offers(self, offers: List[LeaseOffer]) -> List[LeaseOffer]:
+    def open_jsonl_writer(self, filename: Optional[str] = None) -> 'JsonLinesWriter':
         """
-        Validate lease offers.
+        Create a writer that streams offers to a JSON Lines file.
         
         Args:
-            offers (List[LeaseOffer]): List of lease offers
+            filename (str, optional): Output filename
             
         Returns:
-            List[LeaseOffer]: List of valid lease offers
+            JsonLinesWriter: Writer to use as a context manager
         """
-        valid_offers = []
-        
-        for offer in offers:
-            try:
-                # Basic validation is already done by Pydantic
-                # Additional business logic validation can be added here
-                valid_offers.append(offer)
-            except Exception as e:
-                logger.warning(f"Offer validation failed: {str(e)}")
+        if not filename:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            filename = f"lease_offers_{timestamp}.jsonl"
         
-        return valid_offers
+        return JsonLinesWriter(self.output_dir / filename)
+
+
+class JsonLinesWriter:
+    """
+    Appends offers to a JSON Lines file one at a time as they are scraped.
     
-    def _transform_offers(self, offers: List[LeaseOffer]) -> List[LeaseOffer]:
+    Attributes:
+        filepath (Path): Path to the output file
+        count (int): Number of offers written
+    """
+    
+    def __init__(self, filepath: Path):
         """
-        Transform lease offers.
+        Initialize the writer.
         
         Args:
-            offers (List[LeaseOffer]): List of lease offers
-            
-        Returns:
-            List[LeaseOffer]: List of transformed lease offers
+            filepath (Path): Path to the output file
         """
-        transformed_offers = []
-        
-        for offer in offers:
-            # Apply transformations
-            # This is where you would normalize data, enrich with additional info, etc.
-            transformed_offers.append(offer)
+        self.filepath = filepath
+        self.count = 0
+        self._file = None
+    
+    def __enter__(self) -> 'JsonLinesWriter':
+        """Open the output file, replacing any earlier file with the same name."""
+        self._file = open(self.filepath, 'wb')
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Close the output file."""
+        self._file.close()
+        logger.info(f"Saved {self.count} offers to {self.filepath}")
+    
+    def write(self, offer: LeaseOffer):
+        """
+        Append a single offer as one JSON line.
         
-        return transformed_offers
+        Args:
+            offer (LeaseOffer): Offer to write
+        """
+        if orjson is not None:
+            line = orjson.dumps(offer.to_dict())
+        else:
+            line = json.dumps(offer.to_dict(), ensure_ascii=False).encode('utf-8')
+        self._file.write(line + b"\n")
+        self.count += 1
 
 
 class ProcessedData:
@@ -124,24 +144,39 @@ class ProcessedData:
         """
         self.offers = offers
         self.output_dir = output_dir
+        
+        # Offers are not mutated after scraping, so conversions are built once
+        self._dict_list: Optional[List[Dict[str, Any]]] = None
+        self._dataframe: Optional['pd.DataFrame'] = None
     
     def to_dict_list(self) -> List[Dict[str, Any]]:
         """
         Convert offers to a list of dictionaries.
         
+        The list is cached and shared between calls.
+        
         Returns:
             List[Dict[str, Any]]: List of offer dictionaries
         """
-        return [offer.to_dict() for offer in self.offers]
+        if self._dict_list is None:
+            self._dict_list = [offer.to_dict() for offer in self.offers]
+        return self._dict_list
     
-    def to_dataframe(self) -> pd.DataFrame:
+    def to_dataframe(self) -> 'pd.DataFrame':
         """
         Convert offers to a DataFrame.
         
+        The DataFrame is cached and shared between calls.
+        
         Returns:
             pd.DataFrame: DataFrame of offers
         """
-        return pd.DataFrame([offer.to_dict() for offer in self.offers])
+        if self._dataframe is None:
+            # pandas is only needed for analytics, so don't pay its import cost on export
+            import pandas as pd
+            
+            self._dataframe = pd.DataFrame.from_records(self.to_dict_list())
+        return self._dataframe
     
     def save_to_json(self, filename: Optional[str] = None) -> Path:
         """
@@ -159,8 +194,12 @@ class ProcessedData:
         
         filepath = self.output_dir / filename
         
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(self.to_dict_list(), f, ensure_ascii=False, indent=2)
+        if orjson is not None:
+            with open(filepath, 'wb') as f:
+                f.write(orjson.dumps(self.to_dict_list(), option=orjson.OPT_INDENT_2))
+        else:
+            with open(filepath, 'w', encoding='utf-8') as f:
+                json.dump(self.to_dict_list(), f, ensure_ascii=False, indent=2)
         
         logger.info(f"Saved {len(self.offers)} offers to {filepath}")
         return filepath
@@ -180,10 +219,41 @@ class ProcessedData:
             filename = f"lease_offers_{timestamp}.csv"
         
         filepath = self.output_dir / filename
+        fieldnames = [name for name in LeaseOffer.model_fields if name != 'raw_data']
         
-        # Convert to DataFrame
-        df = self.to_dataframe()
-        df.to_csv(filepath, index=False)
+        with open(filepath, 'w', encoding='utf-8', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=fieldnames)
+            writer.writeheader()
+            writer.writerows(self.to_dict_list())
+        
+        logger.info(f"Saved {len(self.offers)} offers to {filepath}")
+        return filepath
+    
+    def save_to_parquet(self, filename: Optional[str] = None) -> Path:
+        """
+        Save offers to a Parquet file.
+        
+        Requires pyarrow (install the "parquet" extra).
+        
+        Args:
+            filename (str, optional): Output filename
+            
+        Returns:
+            Path: Path to the saved file
+        """
+        import pandas as pd
+        
+        if not filename:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            filename = f"lease_offers_{timestamp}.parquet"
+        
+        filepath = self.output_dir / filename
+        
+        # Store timestamps as a datetime column rather than the ISO strings used for JSON
+        df = self.to_dataframe().assign(
+            scrape_timestamp=lambda frame: pd.to_datetime(frame['scrape_timestamp'])
+        )
+        df.to_parquet(filepath, engine='pyarrow', compression='zstd', index=False)
         
         logger.info(f"Saved {len(self.offers)} offers to {filepath}")
         return filepath
@@ -201,16 +271,19 @@ class ProcessedData:
         # Convert to DataFrame for easy stats calculation
         df = self.to_dataframe()
         
+        # Compute all price statistics in a single aggregation
+        prices = df['monthly_price'].agg(['min', 'max', 'mean', 'median'])
+        
         # Basic statistics
         summary = {
             "count": len(self.offers),
             "providers": df['provider'].nunique(),
             "car_makes": df['car_make'].nunique(),
             "price_range": {
-                "min": df['monthly_price'].min(),
-                "max": df['monthly_price'].max(),
-                "avg": df['monthly_price'].mean(),
-                "median": df['monthly_price'].median()
+                "min": float(prices['min']),
+                "max": float(prices['max']),
+                "avg": float(prices['mean']),
+                "median": float(prices['median'])
             },
             "top_makes": df['car_make'].value_counts().head(5).to_dict(),
             "scrape_timestamp": df['scrape_timestamp'].max()
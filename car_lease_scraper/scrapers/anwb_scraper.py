@@ -5,13 +5,179 @@ Implements a scraper for ANWB Private Lease website.
 """
 
 import re
-from typing import List, Optional, Tuple
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
 
-from playwright.async_api import Page, ElementHandle
+from playwright.async_api import Page, ElementHandle, JSHandle, TimeoutError
+from pydantic import ValidationError
 
 from car_lease_scraper.core.base_scraper import BaseScraper
-from car_lease_scraper.models.lease_offer import LeaseOffer
-from car_lease_scraper.utils.parsing import clean_text, extract_price
+from car_lease_scraper.models.lease_offer import LEASE_OFFERS_ADAPTER, LeaseOffer
+from car_lease_scraper.utils.parsing import clean_text, extract_price, parse_lease_terms
+
+
+# Selectors for the car title and price inside an offer card, in order of preference
+_TITLE_SELECTORS = [
+    "h2", "h3", "h4", 
+    "[class*='title']", "[class*='name']", "[class*='model']",
+    "div[class*='car-']", "span[class*='car-']"
+]
+_PRICE_SELECTORS = [
+    "span:has-text('€')", "[class*='price']", "[class*='amount']",
+    "div:has-text('€')", "span[class*='cost']"
+]
+
+# Reads every offer card in a single round-trip. Returns, per card, the text of the
+# first match for each title and price selector, the full text and the image source.
+# ":has-text('€')" is a Playwright-only selector, so it is emulated by text content.
+_READ_CARDS_SCRIPT = """
+({ elements, titleSelectors, priceSelectors }) => {
+    const HAS_EURO = ":has-text('€')";
+    return elements.map(el => {
+        const firstText = selector => {
+            let node;
+            if (selector.endsWith(HAS_EURO)) {
+                const tag = selector.slice(0, -HAS_EURO.length);
+                node = Array.from(el.querySelectorAll(tag)).find(n => n.textContent.includes('€'));
+            } else {
+                node = el.querySelector(selector);
+            }
+            return node ? node.textContent : null;
+        };
+        // image.src is resolved to an absolute URL; placeholders such as data: URIs are skipped
+        const image = el.querySelector('img');
+        const imageUrl = image && /^https?:/.test(image.src) ? image.src : null;
+        return {
+            titles: titleSelectors.map(firstText),
+            prices: priceSelectors.map(firstText),
+            text: el.textContent,
+            image_url: imageUrl,
+        };
+    });
+}
+"""
+# Returns the elements of the first selector, in order of preference, that matches anything
+_FIND_CAR_ELEMENTS_SCRIPT = """
+(selectors) => {
+    for (const selector of selectors) {
+        const elements = document.querySelectorAll(selector);
+        if (elements.length) {
+            return Array.from(elements);
+        }
+    }
+    return [];
+}
+"""
+# Collects the elements matching any container selector and keeps those whose text
+# mentions a car brand, a euro amount and a lease term, all in one round-trip
+_FIND_CAR_CONTENT_SCRIPT = """
+(selectors) => {
+    const brand = /Volkswagen|Toyota|BMW|Audi|Mercedes|Opel|Renault|Ford|Kia/i;
+    const euro = /€|euro/i;
+    const lease = /p\\/m|per maand|lease/i;
+    const seen = new Set();
+    const matches = [];
+    for (const selector of selectors) {
+        for (const el of document.querySelectorAll(selector)) {
+            if (seen.has(el)) continue;
+            seen.add(el);
+            const text = el.textContent;
+            if (brand.test(text) && euro.test(text) && lease.test(text)) {
+                matches.push(el);
+            }
+        }
+    }
+    return matches;
+}
+"""
+
+# Playwright accepts comma-separated selector lists (including :has-text), so each
+# probe below is a single query that returns immediately when nothing matches
+_CONSENT_BUTTON_SELECTOR = ", ".join([
+    "button:has-text('Accepteren')",
+    "button:has-text('Akkoord')",
+    "button:has-text('Accept')",
+    "button[id*='accept']",
+    "button[class*='accept']",
+    "button[data-testid*='cookie-accept']"
+])
+# How long to wait for a consent banner that may never appear
+_CONSENT_TIMEOUT_MS = 2000
+# Car card selectors in order of preference; the specific ones come first and also
+# serve as the signal that listings have rendered
+_CAR_CARD_SELECTORS = [
+    ".car-card", ".card-car", ".car-tile", 
+    ".lease-car", ".lease-tile", ".car-item",
+    ".product-item", "article.card", ".auto-card"
+]
+_CAR_SELECTORS = _CAR_CARD_SELECTORS + [
+    "div[class*='car']", "div[class*='auto']", 
+    "div[class*='lease']", ".card"
+]
+_CAR_CARD_SELECTOR = ", ".join(f"{selector}:visible" for selector in _CAR_CARD_SELECTORS)
+# Links that may lead to the car listings, in order of preference
+_LISTING_LINK_SELECTORS = [
+    f"{selector}:visible"
+    for selector in [
+        "a:has-text(\"Bekijk alle auto's\")",   # View all cars
+        "a:has-text('Aanbod')",                 # Offers
+        "a:has-text(\"Alle auto's\")",          # All cars
+        "a:has-text('Modellen')",               # Models
+        "a:has-text('Private lease')",          # Private lease
+        "a:has-text('Lease aanbiedingen')",     # Lease offers
+        "a:has-text('Auto zoeken')",            # Search car
+        "a:has-text('Aanbod bekijken')",        # View offers
+        "a:has-text('Zoeken')",                 # Search
+        "button:has-text(\"Auto's bekijken\")"  # View cars
+    ]
+]
+_LISTING_LINK_SELECTOR = ", ".join(_LISTING_LINK_SELECTORS)
+_NEXT_PAGE_SELECTOR = ", ".join(
+    f"{selector}:not([disabled])"
+    for selector in [
+        "a.pagination-next",
+        "a[aria-label='Next page']",
+        "button[aria-label='Next page']",
+        "a.next-page",
+        "button.next-page",
+        "a:has-text('Volgende')",  # Dutch for "Next"
+        "button:has-text('Volgende')"
+    ]
+)
+
+# Common Dutch car brands, in the order they are checked
+_COMMON_BRANDS = (
+    "Volkswagen", "Opel", "Peugeot", "Toyota", "Renault", 
+    "Ford", "Kia", "Audi", "BMW", "Citroën", "Seat", "Skoda", 
+    "Hyundai", "Mercedes", "Volvo", "Mazda", "Nissan", "Suzuki", 
+    "Fiat", "Mitsubishi", "Honda", "Dacia", "Porsche", "Tesla"
+)
+_PROMO_TAGS = (
+    "nu met voordeel", "actie", "aanbieding", "special", "bonus", "korting", "gratis"
+)
+
+# Patterns are compiled once here rather than looked up in the re cache for every offer
+# Finds the lease term, kilometers, delivery time and promotional tags in one pass.
+# Delivery times are captured in lookaheads so terms and tags inside them are still seen.
+_DETAIL_RE = re.compile(
+    r'(?P<terms>\d+\s*(?:maanden|mnd)[\s,/|-]*\d[\d.,]*\s*(?:km|kilometer))'
+    r'|(?P<term>\d+)\s*(?:maanden|mnd)'
+    r'|(?P<km>\d[\d.,]*)\s*(?:km|kilometer)'
+    r'|(?:levertijd|levertermijn\s*:)(?=\s*:?\s*(?P<delivery>[^\.]+))'
+    r'|binnen(?=\s*(?P<delivery_within>\d+\s*(?:dagen|weken|maanden)))'
+    r'|(?P<promo>' + "|".join(_PROMO_TAGS) + r')',
+    re.IGNORECASE
+)
+_BRANDS_BY_NAME = {brand.lower(): brand for brand in _COMMON_BRANDS}
+_BRAND_TITLE_RE = re.compile(
+    r'\b(' + "|".join(_COMMON_BRANDS) + r')\b\s+([A-Za-z0-9\s\-]+)', re.IGNORECASE
+)
+_VERSION_RE = re.compile(
+    r'(?P<engine>\d\.\d+\s*[A-Za-z]*)'  # Engine size (e.g., 1.6 TDI)
+    r'|(?P<line>[A-Za-z]+\s*(?:line|edition|series))'  # Line/Edition (e.g., Comfort Line)
+    r'|(?P<trim>(?:comfort|business|sport|luxury)\s*(?:line|edition|pack))',  # Common trim names
+    re.IGNORECASE
+)
 
 
 class ANWBPrivateLeaseScraper(BaseScraper):
@@ -24,12 +190,13 @@ class ANWBPrivateLeaseScraper(BaseScraper):
     provider_name = "anwb"
     base_url = "https://www.anwb.nl/auto/private-lease"
     
-    async def extract_offers(self, page: Page) -> List[LeaseOffer]:
+    async def extract_offers(self, page: Page, scraped_at: datetime) -> List[LeaseOffer]:
         """
         Extract lease offers from ANWB page.
         
         Args:
             page (Page): Playwright page object
+            scraped_at (datetime): Start time of the scrape
             
         Returns:
             List[LeaseOffer]: List of extracted lease offers
@@ -41,18 +208,16 @@ class ANWBPrivateLeaseScraper(BaseScraper):
             await self._handle_cookie_consent(page)
             
             # Take a screenshot to see where we are
-            await page.screenshot(path="after_consent.png")
+            await self.save_debug_snapshot(page, "after_consent")
             
             # Try to find and click on links that might lead to car listings
             await self._navigate_to_car_listings(page)
             
-            # Take a screenshot after navigation attempts
-            await page.screenshot(path="current_page.png")
+            # Save a screenshot and the page content after navigation attempts
+            await self.save_debug_snapshot(page, "current_page", html=True)
             
-            # Save current page content for analysis
-            html_content = await page.content()
-            with open("current_page.html", "w", encoding="utf-8") as f:
-                f.write(html_content)
+            # Navigation returns once the DOM is ready, so give the cards time to render
+            await self._wait_for_car_cards(page)
             
             # Try to find car elements with various selectors
             car_elements = await self._find_car_elements(page)
@@ -61,23 +226,18 @@ class ANWBPrivateLeaseScraper(BaseScraper):
                 self.logger.warning("Could not find any car elements")
                 return []
             
-            # Process found elements
-            offers = []
-            for element in car_elements:
-                try:
-                    offer = await self._extract_offer_data(page, element)
-                    if offer:
-                        offers.append(offer)
-                except Exception as e:
-                    self.logger.error(f"Error extracting offer: {str(e)}")
-                    continue
+            # Read the raw card contents from the browser in one round-trip
+            cards = await self._read_offer_cards(page, car_elements)
+            
+            # Parse the cards off the event loop
+            offers = await self.run_in_parser(self._build_offers, cards, scraped_at)
             
             self.logger.info(f"Successfully extracted {len(offers)} offers")
             return offers
             
         except Exception as e:
             self.logger.error(f"Error during extraction: {str(e)}")
-            await page.screenshot(path="error_screenshot.png")
+            await self.save_debug_snapshot(page, "error", html=True)
             return []
     
     async def _handle_cookie_consent(self, page: Page):
@@ -85,28 +245,19 @@ class ANWBPrivateLeaseScraper(BaseScraper):
         self.logger.info("Checking for cookie consent dialogs")
         
         try:
-            # Check for typical cookie accept buttons
-            consent_selectors = [
-                "button:has-text('Accepteren')",
-                "button:has-text('Akkoord')",
-                "button:has-text('Accept')",
-                "button:has-text('Accept all')",
-                "button[id*='accept']",
-                "button[class*='accept']",
-                "button[data-testid*='cookie-accept']"
-            ]
-            
-            for selector in consent_selectors:
-                try:
-                    visible = await page.is_visible(selector, timeout=2000)
-                    if visible:
-                        self.logger.info(f"Found consent dialog with selector: {selector}")
-                        await page.click(selector)
-                        self.logger.info("Clicked consent button")
-                        await page.wait_for_load_state("networkidle", timeout=5000)
-                        break
-                except Exception:
-                    continue
+            # One probe for all typical cookie accept buttons; the banner is rendered
+            # by a script after the DOM is ready, so give it a moment to appear
+            consent_button = page.locator(_CONSENT_BUTTON_SELECTOR).first
+            try:
+                await consent_button.wait_for(state="visible", timeout=_CONSENT_TIMEOUT_MS)
+            except TimeoutError:
+                self.logger.info("No consent dialog found")
+                return
+            
+            self.logger.info("Found consent dialog")
+            await consent_button.click()
+            self.logger.info("Clicked consent button")
+            await page.wait_for_load_state("domcontentloaded", timeout=5000)
         except Exception as e:
             self.logger.warning(f"Error handling cookie consent: {str(e)}")
     
@@ -114,69 +265,71 @@ class ANWBPrivateLeaseScraper(BaseScraper):
         """Try to navigate to car listings page."""
         self.logger.info("Looking for links to car listings")
         
-        # Potential links that might lead to car listings
-        listing_link_selectors = [
-            "a:has-text('Bekijk alle auto's')",   # View all cars
-            "a:has-text('Aanbod')",               # Offers
-            "a:has-text('Alle auto's')",          # All cars
-            "a:has-text('Modellen')",             # Models
-            "a:has-text('Private lease')",        # Private lease
-            "a:has-text('Lease aanbiedingen')",   # Lease offers
-            "a:has-text('Auto zoeken')",          # Search car
-            "a:has-text('Aanbod bekijken')",      # View offers
-            "a:has-text('Zoeken')",               # Search
-            "button:has-text('Auto's bekijken')"  # View cars
-        ]
+        # One probe for any visible listing link, waiting briefly for one to render
+        try:
+            await page.locator(_LISTING_LINK_SELECTOR).first.wait_for(state="visible", timeout=5000)
+        except Exception:
+            self.logger.warning("Could not navigate to car listings page through links")
+            return
         
-        for selector in listing_link_selectors:
+        # Try the visible links in order of preference until one navigates
+        for selector in _LISTING_LINK_SELECTORS:
             try:
-                if await page.is_visible(selector, timeout=2000):
-                    self.logger.info(f"Found link to listings with selector: {selector}")
-                    
-                    # Get the current URL before clicking
-                    original_url = page.url
-                    
-                    # Click the link
-                    await page.click(selector)
-                    self.logger.info(f"Clicked on: {selector}")
-                    
-                    # Wait for navigation
-                    await page.wait_for_load_state("networkidle", timeout=10000)
-                    
-                    # Check if URL changed
-                    new_url = page.url
-                    if new_url != original_url:
-                        self.logger.info(f"Navigation successful. New URL: {new_url}")
-                        return
-                    else:
-                        self.logger.info("URL did not change after clicking")
+                listing_link = page.locator(selector).first
+                if not await listing_link.count():
+                    continue
+                
+                self.logger.info(f"Found link to listings with selector: {selector}")
+                
+                # Get the current URL before clicking
+                original_url = page.url
+                
+                # Click the link
+                await listing_link.click()
+                self.logger.info(f"Clicked on: {selector}")
+                
+                # Wait for navigation
+                await self._wait_for_car_cards(page)
+                
+                # Check if URL changed
+                new_url = page.url
+                if new_url != original_url:
+                    self.logger.info(f"Navigation successful. New URL: {new_url}")
+                    return
+                else:
+                    self.logger.info("URL did not change after clicking")
             except Exception as e:
                 self.logger.debug(f"Error with selector {selector}: {str(e)}")
         
         self.logger.warning("Could not navigate to car listings page through links")
     
+    async def _wait_for_car_cards(self, page: Page):
+        """
+        Wait for the DOM and the first car card to be ready after a click.
+        
+        Waiting for the content we need is faster and more reliable than
+        waiting for network idle, which trackers and ads can delay indefinitely.
+        
+        Args:
+            page (Page): Playwright page object
+        """
+        try:
+            await page.wait_for_load_state("domcontentloaded", timeout=5000)
+            await page.locator(_CAR_CARD_SELECTOR).first.wait_for(state="visible", timeout=5000)
+        except Exception as e:
+            self.logger.debug(f"No car cards visible yet: {str(e)}")
+    
     async def _find_car_elements(self, page: Page) -> List[ElementHandle]:
         """Find car elements on the page."""
         self.logger.info("Looking for car elements")
         
-        # Try standard selectors first
-        car_selectors = [
-            ".car-card", ".card-car", ".car-tile", 
-            ".lease-car", ".lease-tile", ".car-item",
-            ".product-item", "article.card", ".auto-card",
-            "div[class*='car']", "div[class*='auto']", 
-            "div[class*='lease']", ".card"
-        ]
-        
-        for selector in car_selectors:
-            try:
-                self.logger.info(f"Trying selector: {selector}")
-                elements = await page.query_selector_all(selector)
-                if elements and len(elements) > 0:
-                    self.logger.info(f"Found {len(elements)} elements with selector: {selector}")
-                    return elements
-            except Exception as e:
-                self.logger.debug(f"Error with selector {selector}: {str(e)}")
+        # Try standard selectors first, in order of preference, in one page script
+        # that stops at the first selector with matches
+        matches = await page.evaluate_handle(_FIND_CAR_ELEMENTS_SCRIPT, _CAR_SELECTORS)
+        elements = await self._to_elements(matches)
+        if elements:
+            self.logger.info(f"Found {len(elements)} elements with standard selectors")
+            return elements
         
         # If standard selectors fail, try looking for elements with car-related content
         self.logger.info("Using content-based detection for car elements")
@@ -195,179 +348,190 @@ class ANWBPrivateLeaseScraper(BaseScraper):
             "div.row > div", "div.flex > div"
         ]
         
-        all_potential_elements = []
-        
-        for selector in container_selectors:
-            try:
-                elements = await page.query_selector_all(selector)
-                if elements and len(elements) > 0:
-                    self.logger.info(f"Found {len(elements)} potential container elements with selector: {selector}")
-                    all_potential_elements.extend(elements)
-            except Exception:
-                continue
-        
-        # Filter elements to those that seem to contain car information
-        car_elements = []
-        for element in all_potential_elements:
-            try:
-                text_content = await element.text_content()
-                
-                # Check if the element contains typical car-related text
-                if re.search(r'(?:Volkswagen|Toyota|BMW|Audi|Mercedes|Opel|Renault|Ford|Kia)', text_content, re.IGNORECASE) and \
-                   re.search(r'(?:€|euro)', text_content, re.IGNORECASE) and \
-                   re.search(r'(?:p/m|per maand|lease)', text_content, re.IGNORECASE):
-                    car_elements.append(element)
-            except Exception:
-                continue
+        # Query and filter the candidates in the page instead of reading each one's text
+        matches = await page.evaluate_handle(_FIND_CAR_CONTENT_SCRIPT, container_selectors)
+        car_elements = await self._to_elements(matches)
         
         self.logger.info(f"Found {len(car_elements)} elements with car-related content")
         return car_elements
     
-    async def _extract_offer_data(self, page: Page, offer_element: ElementHandle) -> Optional[LeaseOffer]:
+    async def _to_elements(self, array_handle: JSHandle) -> List[ElementHandle]:
+        """
+        Unpack a handle to an array of elements into element handles.
+        
+        The array handle itself is disposed.
+        
+        Args:
+            array_handle (JSHandle): Handle to an array of DOM elements
+            
+        Returns:
+            List[ElementHandle]: Handles to the elements
+        """
+        try:
+            properties = await array_handle.get_properties()
+        finally:
+            await array_handle.dispose()
+        
+        elements = [prop.as_element() for prop in properties.values()]
+        return [element for element in elements if element is not None]
+    
+    async def _read_offer_cards(self, page: Page, offer_elements: List[ElementHandle]) -> List[Dict[str, Any]]:
         """
-        Extract data from an individual offer element.
+        Read the raw contents of all offer elements in a single page script.
         
         Args:
             page (Page): Playwright page object
-            offer_element (ElementHandle): Element containing the offer
+            offer_elements (List[ElementHandle]): Elements containing the offers
             
         Returns:
-            Optional[LeaseOffer]: Extracted lease offer or None if extraction failed
+            List[Dict[str, Any]]: Per card, the candidate title and price texts, the
+            full text, the image URL and the source URL
         """
+        cards = await page.evaluate(_READ_CARDS_SCRIPT, {
+            "elements": offer_elements,
+            "titleSelectors": _TITLE_SELECTORS,
+            "priceSelectors": _PRICE_SELECTORS,
+        })
+        
+        for card in cards:
+            card["source_url"] = page.url
+        return cards
+    
+    def _build_offers(self, cards: List[Dict[str, Any]], scraped_at: datetime) -> List[LeaseOffer]:
+        """
+        Build lease offers from raw offer cards.
+        
+        Args:
+            cards (List[Dict[str, Any]]): Raw card contents read from the page
+            scraped_at (datetime): Start time of the scrape
+            
+        Returns:
+            List[LeaseOffer]: Offers that could be parsed
+        """
+        records = []
+        for card in cards:
+            record = self._parse_card(card, scraped_at)
+            if record:
+                records.append(record)
+        
         try:
-            # Take a screenshot of this element for debugging
-            element_html = await page.evaluate("(el) => el.outerHTML", offer_element)
-            with open("car_element.html", "w", encoding="utf-8") as f:
-                f.write(element_html)
+            # Validate the whole batch in one go
+            return LEASE_OFFERS_ADAPTER.validate_python(records)
+        except ValidationError:
+            pass
+        
+        # Some records are invalid; validate one by one so only those are dropped
+        offers = []
+        for record in records:
+            try:
+                offers.append(LeaseOffer(**record))
+            except ValidationError as e:
+                self.logger.error(f"Error extracting offer data: {str(e)}")
+        return offers
+    
+    def _parse_card(self, card: Dict[str, Any], scraped_at: datetime) -> Optional[Dict[str, Any]]:
+        """
+        Parse a raw offer card into lease offer fields.
+        
+        Args:
+            card (Dict[str, Any]): Raw card contents read from the page
+            scraped_at (datetime): Start time of the scrape
             
-            # Look for car make/model
-            title_selectors = [
-                "h2", "h3", "h4", 
-                "[class*='title']", "[class*='name']", "[class*='model']",
-                "div[class*='car-']", "span[class*='car-']"
-            ]
+        Returns:
+            Optional[Dict[str, Any]]: LeaseOffer fields or None if parsing failed
+        """
+        try:
+            details_text = card["text"] or ""
             
-            car_title = None
+            # Look for car make/model
             car_title_text = ""
+            for title_text in card["titles"]:
+                title_text = clean_text(title_text)
+                if title_text and len(title_text) > 3:
+                    car_title_text = title_text
+                    break
             
-            for selector in title_selectors:
-                title_element = await offer_element.query_selector(selector)
-                if title_element:
-                    title_text = await title_element.text_content()
-                    title_text = clean_text(title_text)
-                    if title_text and len(title_text) > 3:
-                        car_title = title_element
-                        car_title_text = title_text
-                        self.logger.info(f"Found car title: {car_title_text}")
-                        break
-            
-            if not car_title:
+            if not car_title_text:
                 # If no title element found, try to extract it from the full text
-                full_text = await offer_element.text_content()
-                car_title_text = self._extract_car_title_from_text(full_text)
+                car_title_text = self._extract_car_title_from_text(details_text)
                 if not car_title_text:
                     self.logger.warning("Could not find car title")
                     return None
             
-            car_make, car_model = self._parse_car_make_model(car_title_text)
-            
             # Look for price
             price = 0.0
-            price_selectors = [
-                "span:has-text('€')", "[class*='price']", "[class*='amount']",
-                "div:has-text('€')", "span[class*='cost']"
-            ]
-            
-            for selector in price_selectors:
-                price_element = await offer_element.query_selector(selector)
-                if price_element:
-                    price_text = await price_element.text_content()
-                    price = extract_price(price_text)
-                    if price > 0:
-                        self.logger.info(f"Found price: €{price:.2f}")
-                        break
+            for price_text in card["prices"]:
+                price = extract_price(price_text)
+                if price > 0:
+                    break
             
             if price <= 0:
                 self.logger.warning("Could not find valid price")
                 return None
             
-            # Extract other details with more flexible approach
-            details_text = await offer_element.text_content()
-            
-            # Extract lease terms
-            lease_term = 48  # Default
-            kilometers = 10000  # Default
-            
-            # Look for month/kilometers pattern in the text
-            term_match = re.search(r'(\d+)\s*(?:maanden|mnd)', details_text, re.IGNORECASE)
-            if term_match:
-                lease_term = int(term_match.group(1))
+            car_make, car_model = self._parse_car_make_model(car_title_text)
             
-            km_match = re.search(r'(\d[\d.,]*)\s*(?:km|kilometer)', details_text, re.IGNORECASE)
-            if km_match:
-                km_text = km_match.group(1).replace('.', '').replace(',', '')
-                kilometers = int(km_text)
+            # Extract lease terms, delivery time and promotional tags in a single scan;
+            # the first term, kilometers and delivery time found win
+            lease_term = None
+            kilometers = None
+            delivery_time = None
+            delivery_within = None
+            found_tags = set()
+            
+            for match in _DETAIL_RE.finditer(details_text):
+                kind = match.lastgroup
+                if kind == "terms":
+                    # Term and kilometers written together, e.g. "48 maanden, 10.000 km"
+                    months, kilometers_per_year = parse_lease_terms(match.group("terms"))
+                    if lease_term is None:
+                        lease_term = months
+                    if kilometers is None:
+                        kilometers = kilometers_per_year
+                elif kind == "term":
+                    if lease_term is None:
+                        lease_term = int(match.group("term"))
+                elif kind == "km":
+                    if kilometers is None:
+                        kilometers = int(match.group("km").replace('.', '').replace(',', ''))
+                elif kind == "delivery":
+                    if delivery_time is None:
+                        delivery_time = clean_text(match.group("delivery"))
+                elif kind == "delivery_within":
+                    if delivery_within is None:
+                        delivery_within = clean_text(match.group("delivery_within"))
+                elif kind == "promo":
+                    found_tags.add(match.group("promo").lower())
+            
+            if lease_term is None:
+                lease_term = 48  # Default
+            if kilometers is None:
+                kilometers = 10000  # Default
+            # "Levertijd" wins over "binnen ..." wherever it appears
+            delivery_time = delivery_time or delivery_within
+            promo_tags = [tag.capitalize() for tag in _PROMO_TAGS if tag in found_tags]
             
             # Extract version/trim
             version = self._extract_version(details_text, car_make, car_model)
             
-            # Extract delivery time if available
-            delivery_time = None
-            delivery_patterns = [
-                r'levertijd\s*:\s*([^\.]+)',
-                r'levertijd\s*([^\.]+)',
-                r'levertermijn\s*:\s*([^\.]+)',
-                r'binnen\s*(\d+\s*(?:dagen|weken|maanden))'
-            ]
-            
-            for pattern in delivery_patterns:
-                delivery_match = re.search(pattern, details_text, re.IGNORECASE)
-                if delivery_match:
-                    delivery_time = clean_text(delivery_match.group(1))
-                    break
-            
-            # Extract promotional tags
-            promo_tags = []
-            promo_patterns = [
-                r'nu met voordeel',
-                r'actie',
-                r'aanbieding',
-                r'special',
-                r'bonus',
-                r'korting',
-                r'gratis'
-            ]
-            
-            for pattern in promo_patterns:
-                if re.search(pattern, details_text, re.IGNORECASE):
-                    promo_tags.append(pattern.capitalize())
-            
-            # Extract image URL
-            image_url = None
-            image_element = await offer_element.query_selector("img")
-            if image_element:
-                image_url = await image_element.get_attribute("src")
-            
-            # Create LeaseOffer object
-            offer = LeaseOffer(
-                car_make=car_make,
-                car_model=car_model,
-                version=version,
-                monthly_price=price,
-                lease_term_months=lease_term,
-                kilometers_per_year=kilometers,
-                delivery_time=delivery_time,
-                promotional_tags=promo_tags,
-                image_url=image_url,
-                source_url=self.car_listings_url,
-                provider=self.provider_name,
-                raw_data={
+            return {
+                "car_make": car_make,
+                "car_model": car_model,
+                "version": version,
+                "monthly_price": price,
+                "lease_term_months": lease_term,
+                "kilometers_per_year": kilometers,
+                "delivery_time": delivery_time,
+                "promotional_tags": promo_tags,
+                "image_url": card["image_url"],
+                "scrape_timestamp": scraped_at,
+                "source_url": card["source_url"],
+                "provider": self.provider_name,
+                "raw_data": {
                     "title": car_title_text,
                     "details": details_text
                 }
-            )
-            
-            return offer
+            }
         
         except Exception as e:
             self.logger.error(f"Error extracting offer data: {str(e)}")
@@ -375,20 +539,12 @@ class ANWBPrivateLeaseScraper(BaseScraper):
     
     def _extract_car_title_from_text(self, text: str) -> str:
         """Extract car title from full text."""
-        # Look for common car brand patterns
-        common_brands = [
-            "Volkswagen", "Opel", "Peugeot", "Toyota", "Renault", 
-            "Ford", "Kia", "Audi", "BMW", "Citroën", "Seat", "Skoda", 
-            "Hyundai", "Mercedes", "Volvo", "Mazda", "Nissan", "Suzuki", 
-            "Fiat", "Mitsubishi", "Honda", "Dacia", "Porsche", "Tesla"
-        ]
-        
-        for brand in common_brands:
-            pattern = fr'{brand}\s+([A-Za-z0-9\s\-]+)'
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                model = match.group(1).strip()
-                return f"{brand} {model}"
+        # Look for the first mention of a common car brand
+        match = _BRAND_TITLE_RE.search(text)
+        if match:
+            brand = _BRANDS_BY_NAME[match.group(1).lower()]
+            model = match.group(2).strip()
+            return f"{brand} {model}"
         
         return ""
     
@@ -405,42 +561,33 @@ class ANWBPrivateLeaseScraper(BaseScraper):
         if not car_title:
             return "Unknown", "Unknown"
         
-        # Common Dutch car brands to check first
-        common_brands = [
-            "Volkswagen", "Opel", "Peugeot", "Toyota", "Renault", 
-            "Ford", "Kia", "Audi", "BMW", "Citroën", "Seat", "Skoda", 
-            "Hyundai", "Mercedes", "Volvo", "Mazda", "Nissan", "Suzuki", 
-            "Fiat", "Mitsubishi", "Honda", "Dacia", "Porsche", "Tesla"
-        ]
+        first_word, _, rest = car_title.partition(" ")
+        if not rest:
+            return first_word, "Unknown"
         
-        for brand in common_brands:
-            if car_title.lower().startswith(brand.lower()):
-                return brand, car_title[len(brand):].strip()
+        # Common Dutch car brands are looked up by the first word
+        brand = _BRANDS_BY_NAME.get(first_word.lower())
+        if brand:
+            return brand, rest.strip()
         
         # Default fallback: split on first space
-        parts = car_title.split(" ", 1)
-        if len(parts) == 1:
-            return parts[0], "Unknown"
-        return parts[0], parts[1]
+        return first_word, rest
     
     def _extract_version(self, details_text: str, make: str, model: str) -> Optional[str]:
         """Extract version/trim from details text."""
         # Remove car make and model from the text to avoid confusion
         cleaned_text = details_text.replace(make, "").replace(model, "")
         
-        # Look for common version/trim patterns
-        patterns = [
-            r'(\d\.\d+\s*[A-Za-z]*)',  # Engine size (e.g., 1.6 TDI)
-            r'([A-Za-z]+\s*(?:line|edition|series))',  # Line/Edition (e.g., Comfort Line)
-            r'((?:comfort|business|sport|luxury)\s*(?:line|edition|pack))',  # Common trim names
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, cleaned_text, re.IGNORECASE)
-            if match:
-                return match.group(1).strip()
+        # Look for common version/trim patterns in one scan; an engine size wins,
+        # then a line/edition, then a trim name, wherever each appears
+        found = {}
+        for match in _VERSION_RE.finditer(cleaned_text):
+            kind = match.lastgroup
+            if kind == "engine":
+                return match.group(kind).strip()
+            found.setdefault(kind, match.group(kind).strip())
         
-        return None
+        return found.get("line") or found.get("trim")
     
     async def has_next_page(self, page: Page) -> bool:
         """
@@ -452,25 +599,10 @@ class ANWBPrivateLeaseScraper(BaseScraper):
         Returns:
             bool: Whether there is a next page
         """
-        pagination_selectors = [
-            "a.pagination-next", 
-            "a[aria-label='Next page']",
-            "button[aria-label='Next page']",
-            "a.next-page",
-            "button.next-page",
-            "a:has-text('Volgende')",  # Dutch for "Next"
-            "button:has-text('Volgende')"
-        ]
-        
-        for selector in pagination_selectors:
-            try:
-                next_button = await page.query_selector(selector + ":not([disabled])")
-                if next_button:
-                    return True
-            except Exception:
-                continue
-        
-        return False
+        try:
+            return await page.query_selector(_NEXT_PAGE_SELECTOR) is not None
+        except Exception:
+            return False
     
     async def go_to_next_page(self, page: Page):
         """
@@ -479,25 +611,21 @@ class ANWBPrivateLeaseScraper(BaseScraper):
         Args:
             page (Page): Playwright page object
         """
-        pagination_selectors = [
-            "a.pagination-next", 
-            "a[aria-label='Next page']",
-            "button[aria-label='Next page']",
-            "a.next-page",
-            "button.next-page",
-            "a:has-text('Volgende')",  # Dutch for "Next"
-            "button:has-text('Volgende')"
-        ]
-        
-        for selector in pagination_selectors:
-            try:
-                next_button = await page.query_selector(selector + ":not([disabled])")
-                if next_button:
-                    await next_button.click()
-                    await page.wait_for_load_state("networkidle")
-                    await page.screenshot(path=f"page_{page.url}.png")
-                    return
-            except Exception:
-                continue
+        try:
+            next_button = await page.query_selector(_NEXT_PAGE_SELECTOR)
+            if next_button:
+                original_url = page.url
+                await next_button.click()
+                
+                # Pagination usually changes the URL; if it doesn't, just wait for cards
+                try:
+                    await page.wait_for_url(lambda url: url != original_url, timeout=5000)
+                except Exception:
+                    self.logger.debug("URL did not change after clicking next page")
+                await self._wait_for_car_cards(page)
+                await self.save_debug_snapshot(page, "next_page")
+                return
+        except Exception:
+            pass
         
         self.logger.warning("Could not navigate to next page")
\ No newline at end of file
@@ -5,8 +5,8 @@ Provides a registry for discovering and managing scrapers.
 """
 
 import importlib
-import inspect
-from typing import Dict, List, Type, Any
+import pkgutil
+from typing import Dict, List, Set, Type, Any
 
 from car_lease_scraper.core.base_scraper import BaseScraper
 from car_lease_scraper.utils.logging import get_logger
@@ -26,6 +26,8 @@ class ScraperRegistry:
     def __init__(self):
         """Initialize the registry."""
         self._scrapers: Dict[str, Type[BaseScraper]] = {}
+        self._registered: Set[Type[BaseScraper]] = set()
+        self._discovered = False
     
     def register(self, scraper_class: Type[BaseScraper]):
         """
@@ -34,6 +36,10 @@ class ScraperRegistry:
         Args:
             scraper_class (Type[BaseScraper]): Scraper class to register
         """
+        # Registering the same class again is a no-op
+        if scraper_class in self._registered:
+            return
+        
         if not issubclass(scraper_class, BaseScraper):
             raise TypeError(f"{scraper_class.__name__} is not a subclass of BaseScraper")
         
@@ -42,6 +48,7 @@ class ScraperRegistry:
             raise ValueError(f"{scraper_class.__name__} has no provider_name defined")
         
         self._scrapers[provider_name] = scraper_class
+        self._registered.add(scraper_class)
         logger.debug(f"Registered scraper for provider: {provider_name}")
     
     def get_scraper(self, provider_name: str) -> Type[BaseScraper]:
@@ -89,14 +96,18 @@ class ScraperRegistry:
     
     def discover_scrapers(self):
         """Automatically discover and register scrapers."""
+        # Modules are only imported once, so there is nothing new to find on later calls
+        if self._discovered:
+            return
+        
         # Import scrapers module to make sure all scrapers are loaded
         import car_lease_scraper.scrapers
         
-        # Get all modules in the scrapers package
+        # Enumerate the modules on disk rather than those that happen to be imported
         package = car_lease_scraper.scrapers
         module_names = [
-            name for name in dir(package) 
-            if not name.startswith('_') and name != 'registry'
+            module_info.name for module_info in pkgutil.iter_modules(package.__path__)
+            if not module_info.name.startswith('_') and module_info.name != 'registry'
         ]
         
         # Import each module and register scraper classes
@@ -104,15 +115,19 @@ class ScraperRegistry:
             try:
                 module = importlib.import_module(f"car_lease_scraper.scrapers.{module_name}")
                 
-                # Find all scraper classes in the module
-                for name, obj in inspect.getmembers(module, inspect.isclass):
-                    if (issubclass(obj, BaseScraper) and 
+                # Find all scraper classes in the module; checking the MRO directly
+                # avoids ABCMeta's subclass hooks for every class in the module
+                for obj in list(vars(module).values()):
+                    if (isinstance(obj, type) and
                         obj is not BaseScraper and 
+                        BaseScraper in obj.__mro__ and 
                         obj.provider_name):
                         self.register(obj)
                 
             except ImportError as e:
                 logger.error(f"Error importing module {module_name}: {str(e)}")
+        
+        self._discovered = True
 
 
 # Create global registry instance
@@ -6,6 +6,7 @@ Provides utilities to help evade bot detection while scraping.
 
 import asyncio
 import random
+import re
 from typing import Optional, List
 
 from playwright.async_api import BrowserContext, Page
@@ -15,6 +16,72 @@ from car_lease_scraper.utils.logging import get_logger
 
 logger = get_logger("anti_bot")
 
+_CAPTCHA_TEXT_INDICATORS = [
+    # Text indicators
+    "captcha", "robot", "human verification", "security check", "prove you're human",
+    # Common CAPTCHA providers
+    "recaptcha", "hcaptcha", "arkoselabs", "funcaptcha", "turnstile"
+]
+_CAPTCHA_ELEMENT_SELECTORS = [
+    # Common CAPTCHA element IDs and classes
+    "#captcha", ".captcha", "#recaptcha", ".g-recaptcha", ".h-captcha"
+]
+
+# Matches any text indicator in a single pass; case-insensitive matching avoids
+# lowercasing a copy of the whole document
+_CAPTCHA_RE = re.compile("|".join(re.escape(indicator) for indicator in _CAPTCHA_TEXT_INDICATORS), re.IGNORECASE)
+
+# All element indicators combined into one selector list
+_CAPTCHA_ELEMENT_SELECTOR = ", ".join(_CAPTCHA_ELEMENT_SELECTORS)
+
+_SCROLL_AND_BACK_SCRIPT = """
+async ({ amount, pauseMs }) => {
+    window.scrollBy(0, amount);
+    await new Promise(resolve => setTimeout(resolve, pauseMs));
+    window.scrollBy(0, -Math.floor(amount / 2));
+}
+"""
+
+# Patches applied to every new document to evade bot detection
+_STEALTH_SCRIPT = """
+(() => {
+    // Hide webdriver property
+    Object.defineProperty(navigator, 'webdriver', {
+        get: () => false,
+    });
+    
+    // Add canvas noise to prevent fingerprinting
+    const originalGetContext = HTMLCanvasElement.prototype.getContext;
+    HTMLCanvasElement.prototype.getContext = function(type) {
+        const context = originalGetContext.apply(this, arguments);
+        if (type === '2d') {
+            const originalFillText = context.fillText;
+            context.fillText = function() {
+                const args = arguments;
+                args[0] = args[0] + ' '; // Add tiny noise
+                return originalFillText.apply(this, args);
+            };
+        }
+        return context;
+    };
+    
+    // Mask plugins and mime types
+    Object.defineProperty(navigator, 'plugins', {
+        get: () => {
+            return [
+                {
+                    0: {type: "application/pdf", suffixes: "pdf", description: "Portable Document Format"},
+                    name: "PDF Viewer",
+                    filename: "internal-pdf-viewer",
+                    description: "Portable Document Format",
+                    length: 1
+                }
+            ];
+        },
+    });
+})();
+"""
+
 
 async def add_stealth_scripts(context: BrowserContext):
     """
@@ -23,46 +90,8 @@ async def add_stealth_scripts(context: BrowserContext):
     Args:
         context (BrowserContext): Playwright browser context
     """
-    # Hide webdriver property
-    await context.add_init_script("""
-        Object.defineProperty(navigator, 'webdriver', {
-            get: () => false,
-        });
-    """)
-    
-    # Add canvas noise to prevent fingerprinting
-    await context.add_init_script("""
-        const originalGetContext = HTMLCanvasElement.prototype.getContext;
-        HTMLCanvasElement.prototype.getContext = function(type) {
-            const context = originalGetContext.apply(this, arguments);
-            if (type === '2d') {
-                const originalFillText = context.fillText;
-                context.fillText = function() {
-                    const args = arguments;
-                    args[0] = args[0] + ' '; // Add tiny noise
-                    return originalFillText.apply(this, args);
-                };
-            }
-            return context;
-        };
-    """)
-    
-    # Mask plugins and mime types
-    await context.add_init_script("""
-        Object.defineProperty(navigator, 'plugins', {
-            get: () => {
-                return [
-                    {
-                        0: {type: "application/pdf", suffixes: "pdf", description: "Portable Document Format"},
-                        name: "PDF Viewer",
-                        filename: "internal-pdf-viewer",
-                        description: "Portable Document Format",
-                        length: 1
-                    }
-                ];
-            },
-        });
-    """)
+    # All patches are installed with a single init script
+    await context.add_init_script(_STEALTH_SCRIPT)
 
 
 async def detect_captcha(page: Page) -> bool:
@@ -75,31 +104,18 @@ async def detect_captcha(page: Page) -> bool:
     Returns:
         bool: Whether a CAPTCHA was detected
     """
-    captcha_indicators = [
-        # Text indicators
-        "captcha", "robot", "human verification", "security check", "prove you're human",
-        # Common CAPTCHA providers
-        "recaptcha", "hcaptcha", "arkoselabs", "funcaptcha", "turnstile",
-        # Common CAPTCHA element IDs and classes
-        "#captcha", ".captcha", "#recaptcha", ".g-recaptcha", ".h-captcha"
-    ]
-    
     # Check page content for CAPTCHA indicators
     content = await page.content()
-    content_lower = content.lower()
     
-    for indicator in captcha_indicators:
-        if indicator in content_lower:
-            logger.warning(f"CAPTCHA detected: {indicator}")
-            return True
+    match = _CAPTCHA_RE.search(content)
+    if match:
+        logger.warning(f"CAPTCHA detected: {match.group(0).lower()}")
+        return True
     
     # Check for CAPTCHA elements
-    for indicator in captcha_indicators:
-        if indicator.startswith('#') or indicator.startswith('.'):
-            element = await page.query_selector(indicator)
-            if element:
-                logger.warning(f"CAPTCHA element detected: {indicator}")
-                return True
+    if await page.query_selector(_CAPTCHA_ELEMENT_SELECTOR):
+        logger.warning("CAPTCHA element detected")
+        return True
     
     return False
 
@@ -143,28 +159,29 @@ async def simulate_human_behavior(page: Page):
     # Random delay before any actions
     await asyncio.sleep(random.uniform(1, 3))
     
-    # Get page dimensions
-    viewport = await page.evaluate("""
-        () => ({
-            width: window.innerWidth,
-            height: window.innerHeight
-        })
-    """)
-    
-    # Perform random mouse movements
+    # Get page dimensions, from the context settings when set to avoid a round-trip
+    viewport = page.viewport_size
+    if viewport is None:
+        viewport = await page.evaluate("""
+            () => ({
+                width: window.innerWidth,
+                height: window.innerHeight
+            })
+        """)
+    
+    # Perform random mouse movements; each move is already interpolated over several
+    # steps and waits on the browser, so only pause once afterwards
     for _ in range(random.randint(3, 8)):
         await page.mouse.move(
             random.randint(100, viewport['width'] - 200),
             random.randint(100, viewport['height'] - 200),
             steps=random.randint(5, 15)  # Move in steps for more human-like movement
         )
-        await asyncio.sleep(random.uniform(0.1, 0.5))
-    
-    # Random scrolling
-    scroll_amount = random.randint(300, 1000)
-    await page.evaluate(f"window.scrollBy(0, {scroll_amount})")
-    await asyncio.sleep(random.uniform(0.5, 1.5))
+    await asyncio.sleep(random.uniform(0.3, 1.5))
     
-    # Scroll back up a bit
-    await page.evaluate(f"window.scrollBy(0, {-scroll_amount // 2})")
+    # Random scrolling, then scroll back up a bit, in a single in-page script
+    await page.evaluate(_SCROLL_AND_BACK_SCRIPT, {
+        "amount": random.randint(300, 1000),
+        "pauseMs": random.randint(500, 1500)
+    })
     await asyncio.sleep(random.uniform(0.3, 0.7))
\ No newline at end of file
@@ -6,16 +6,66 @@ Provides consistent logging setup across the application.
 
 import logging
 import sys
-from typing import Optional
-
-from rich.console import Console
-from rich.logging import RichHandler
+from typing import TYPE_CHECKING, Dict, Optional
 
 from car_lease_scraper.config import SETTINGS
 
+if TYPE_CHECKING:
+    from rich.console import Console
+
+
+# Global console instance, created on first use
+_console: Optional['Console'] = None
+
+# Loggers whose handlers were already set up by get_logger, keyed by name
+_LOGGER_CACHE: Dict[str, logging.Logger] = {}
+
+
+def _get_console() -> 'Console':
+    """
+    Get the shared Rich console for log output, creating it on first use.
+    
+    It writes to stderr, the stream whose terminal is checked in _console_handler.
+    
+    Returns:
+        Console: Rich console instance
+    """
+    global _console
+    if _console is None:
+        # Rich is imported lazily as its terminal detection is slow at startup
+        from rich.console import Console
+        
+        _console = Console(stderr=True)
+    return _console
+
 
-# Global console instance
-console = Console()
+def _console_handler() -> logging.Handler:
+    """
+    Create a handler for console output.
+    
+    Rich output is only worth its per-record cost in an interactive terminal;
+    when stderr is redirected (CI, Docker logs, pytest capture) a plain
+    stream handler is used instead.
+    
+    Returns:
+        logging.Handler: Configured logging handler
+    """
+    if not sys.stderr.isatty():
+        handler = logging.StreamHandler(sys.stderr)
+        handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s %(message)s"))
+        return handler
+    
+    from rich.logging import RichHandler
+    
+    # Create rich handler for nice console output
+    handler = RichHandler(
+        rich_tracebacks=True,
+        console=_get_console(),
+        show_time=True,
+        show_path=False
+    )
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    return handler
 
 
 def get_logger(name: str, level: Optional[str] = None) -> logging.Logger:
@@ -29,27 +79,26 @@ def get_logger(name: str, level: Optional[str] = None) -> logging.Logger:
     Returns:
         logging.Logger: Configured logger
     """
-    log_level = level or SETTINGS.log_level
+    level_no = getattr(logging, level or SETTINGS.log_level)
     
-    # Create logger
-    logger = logging.getLogger(name)
-    logger.setLevel(getattr(logging, log_level))
-    
-    # Check if logger already has handlers to avoid duplicate
-    if not logger.handlers:
-        # Create rich handler for nice console output
-        handler = RichHandler(
-            rich_tracebacks=True,
-            console=console,
-            show_time=True,
-            show_path=False
-        )
-        handler.setFormatter(logging.Formatter("%(message)s"))
-        logger.addHandler(handler)
+    # Reuse a logger set up earlier without taking the logging lock again
+    logger = _LOGGER_CACHE.get(name)
+    if logger is None:
+        # Create logger
+        logger = logging.getLogger(name)
+        
+        # Check if logger already has handlers to avoid duplicate
+        if not logger.handlers:
+            logger.addHandler(_console_handler())
+            
+            # Propagate to root logger
+            logger.propagate = False
         
-        # Propagate to root logger
-        logger.propagate = False
+        _LOGGER_CACHE[name] = logger
     
+    # setLevel clears the logging cache, so only call it when the level changes
+    if logger.level != level_no:
+        logger.setLevel(level_no)
     return logger
 
 
@@ -59,12 +108,5 @@ def setup_root_logger():
         level=getattr(logging, SETTINGS.log_level),
         format="%(message)s",
         datefmt="[%Y-%m-%d %H:%M:%S]",
-        handlers=[
-            RichHandler(
-                rich_tracebacks=True,
-                console=console,
-                show_time=True,
-                show_path=False
-            )
-        ]
+        handlers=[_console_handler()]
     )
\ No newline at end of file
@@ -4,8 +4,36 @@ Parsing Utilities
 Provides utility functions for text parsing and data extraction.
 """
 
+import functools
 import re
-from typing import Optional, Union
+from typing import NamedTuple, Optional, Tuple, Union
+
+
+# A number as written: a digit followed by digits and decimal/thousand separators
+_NUMBER_RE = re.compile(r'\d[\d.,]*')
+_STRIP_SEPARATORS = str.maketrans('', '', '.,')
+
+# Common abbreviations and specific cases
+_MAKE_CORRECTIONS = {
+    "Vw": "Volkswagen",
+    "Bmw": "BMW",
+    "Mercedes": "Mercedes-Benz",
+    "Mercedes Benz": "Mercedes-Benz",
+    "Citroen": "Citroën",
+}
+
+
+class MakeModel(NamedTuple):
+    """
+    Normalized car make and model.
+    
+    Attributes:
+        make (str): Car make
+        model (str): Car model
+    """
+    
+    make: str
+    model: str
 
 
 def clean_text(text: Optional[str]) -> Optional[str]:
@@ -16,18 +44,13 @@ def clean_text(text: Optional[str]) -> Optional[str]:
         text (str, optional): Text to clean
         
     Returns:
-        str, optional: Cleaned text
+        str, optional: Cleaned text, or None if no text remains
     """
     if not text:
         return None
     
-    # Remove excess whitespace
-    text = re.sub(r'\s+', ' ', text.strip())
-    
-    # Replace non-breaking spaces with regular spaces
-    text = text.replace('\xa0', ' ')
-    
-    return text
+    # Collapse runs of whitespace, including non-breaking spaces, into single spaces
+    return ' '.join(text.split()) or None
 
 
 def extract_price(text: Optional[str]) -> float:
@@ -44,19 +67,21 @@ def extract_price(text: Optional[str]) -> float:
         return 0.0
     
     # Extract digits and decimal/thousand separators
-    price_match = re.search(r'(\d[\d.,]*)', text)
+    price_match = _NUMBER_RE.search(text)
     if not price_match:
         return 0.0
     
-    price_str = price_match.group(1)
+    price_str = price_match.group()
     
-    # Handle different number formats
-    # For Dutch format (€ 123,45)
-    if ',' in price_str and '.' not in price_str:
-        price_str = price_str.replace(',', '.')
-    # For format with thousand separators (€ 1.234,56)
-    elif ',' in price_str and '.' in price_str:
+    # The last separator is the decimal separator
+    last_dot = price_str.rfind('.')
+    last_comma = price_str.rfind(',')
+    # For Dutch format (€ 123,45 or € 1.234,56)
+    if last_comma > last_dot:
         price_str = price_str.replace('.', '').replace(',', '.')
+    # For English format (€ 123.45 or € 1,234.56)
+    elif last_dot > last_comma:
+        price_str = price_str.replace(',', '')
     
     try:
         return round(float(price_str), 2)
@@ -78,14 +103,12 @@ def extract_number(text: Optional[str]) -> Optional[int]:
         return None
     
     # Extract digits
-    number_match = re.search(r'(\d[\d.,]*)', text)
+    number_match = _NUMBER_RE.search(text)
     if not number_match:
         return None
     
-    number_str = number_match.group(1)
-    
     # Remove thousand separators
-    number_str = number_str.replace('.', '').replace(',', '')
+    number_str = number_match.group().translate(_STRIP_SEPARATORS)
     
     try:
         return int(number_str)
@@ -93,28 +116,56 @@ def extract_number(text: Optional[str]) -> Optional[int]:
         return None
 
 
-def normalize_make_model(make: str, model: str) -> tuple[str, str]:
+def parse_lease_terms(
+    text: Optional[str],
+    default_months: int = 48,
+    default_kilometers: int = 10000
+) -> Tuple[int, int]:
+    """
+    Extract the lease term and yearly kilometers from lease terms text.
+    
+    Args:
+        text (str, optional): Lease terms text, e.g. "48 maanden, 10.000 km per jaar"
+        default_months (int): Lease term to use if none is found
+        default_kilometers (int): Kilometers per year to use if none are found
+        
+    Returns:
+        Tuple[int, int]: (lease term in months, kilometers per year)
+    """
+    if not text:
+        return default_months, default_kilometers
+    
+    # Lease terms read "<months> maanden, <kilometers> km": take the first two numbers.
+    # Each search is linear, as a run of digits and separators cannot backtrack.
+    months_match = _NUMBER_RE.search(text)
+    if not months_match:
+        return default_months, default_kilometers
+    
+    km_match = _NUMBER_RE.search(text, months_match.end())
+    if not km_match:
+        return default_months, default_kilometers
+    
+    months = months_match.group().translate(_STRIP_SEPARATORS)
+    kilometers = km_match.group().translate(_STRIP_SEPARATORS)
+    return int(months), int(kilometers)
+
+
+@functools.lru_cache(maxsize=512)
+def normalize_make_model(make: str, model: str) -> MakeModel:
     """
     Normalize car make and model.
     
+    Results are cached, as the same few makes and models recur across offers.
+    
     Args:
         make (str): Car make
         model (str): Car model
         
     Returns:
-        tuple[str, str]: Normalized (make, model)
+        MakeModel: Normalized make and model
     """
     # Convert to title case
     make = make.title()
     
-    # Common abbreviations and specific cases
-    make_corrections = {
-        "Vw": "Volkswagen",
-        "Bmw": "BMW",
-        "Mercedes": "Mercedes-Benz",
-        "Mercedes Benz": "Mercedes-Benz",
-        "Citroen": "Citroën",
-    }
-    
     # Apply corrections
-    return make_corrections.get(make, make), model
\ No newline at end of file
+    return MakeModel(_MAKE_CORRECTIONS.get(make, make), model)
\ No newline at end of file
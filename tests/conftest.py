@@ -6,7 +6,7 @@ Shared fixtures and utilities for tests.
 
 import os
 import pytest
-import asyncio
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import Generator
 
@@ -50,23 +50,12 @@ def sample_lease_offer_data() -> dict:
         "delivery_time": "Levertijd: 2-3 maanden",
         "promotional_tags": ["Nu met voordeel", "Actie"],
         "image_url": "https://example.com/car.jpg",
+        "scrape_timestamp": datetime(2024, 1, 1, tzinfo=timezone.utc),
         "source_url": "https://www.anwb.nl/auto/private-lease",
         "provider": "anwb"
     }
 
 
-@pytest.fixture(scope="session")
-def event_loop():
-    """
-    Create an event loop for async tests.
-    
-    This is needed for pytest-asyncio to work with session-scoped fixtures.
-    """
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
-
-
 @pytest.fixture(autouse=True)
 def setup_test_env(monkeypatch):
     """
@@ -0,0 +1,31 @@
+"""
+Anti-Bot Tests
+
+Tests for the anti-bot utilities.
+"""
+
+from unittest.mock import AsyncMock
+
+from car_lease_scraper.utils.anti_bot import detect_captcha
+
+
+async def test_detect_captcha_in_content():
+    """Test that CAPTCHA text is detected with a single selector query at most."""
+    page = AsyncMock()
+    page.content = AsyncMock(return_value="<html><div>Please complete the reCAPTCHA</div></html>")
+    
+    assert await detect_captcha(page) is True
+    page.query_selector.assert_not_awaited()
+
+
+async def test_detect_captcha_by_element():
+    """Test that CAPTCHA elements are checked with one combined selector."""
+    page = AsyncMock()
+    page.content = AsyncMock(return_value="<html><div>Lease offers</div></html>")
+    page.query_selector = AsyncMock(return_value=None)
+    
+    assert await detect_captcha(page) is False
+    assert page.query_selector.await_count == 1
+    
+    page.query_selector = AsyncMock(return_value=object())
+    assert await detect_captcha(page) is True
@@ -6,92 +6,143 @@ Tests for the ANWB Private Lease scraper.
 
 import pytest
 import asyncio
+from datetime import datetime, timezone
 from unittest.mock import patch, MagicMock, AsyncMock
 
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
 from car_lease_scraper.scrapers.anwb_scraper import ANWBPrivateLeaseScraper
 from car_lease_scraper.models.lease_offer import LeaseOffer
 
 
 @pytest.fixture
-def mock_offer_element():
-    """Create a mock offer element."""
-    element = AsyncMock()
-    
-    # Set up text content returns
-    async def mock_text_content():
-        return "Volkswagen Golf"
-    
-    # Mock query_selector to return child elements
-    async def mock_query_selector(selector):
-        child = AsyncMock()
-        
-        if selector == ".car-title":
-            child.text_content = mock_text_content
-            return child
-        elif selector == ".car-subtitle":
-            child.text_content = AsyncMock(return_value="Comfort Line 1.5 TSI")
-            return child
-        elif selector == ".price-amount":
-            child.text_content = AsyncMock(return_value="€389,00")
-            return child
-        elif selector == ".lease-terms":
-            child.text_content = AsyncMock(return_value="48 maanden, 10.000 km per jaar")
-            return child
-        elif selector == ".delivery-time":
-            child.text_content = AsyncMock(return_value="Levertijd: 2-3 maanden")
-            return child
-        elif selector == "img.car-image":
-            child.get_attribute = AsyncMock(return_value="https://example.com/car.jpg")
-            return child
-        
-        return None
-    
-    element.query_selector = mock_query_selector
-    
-    # Mock query_selector_all for promotional tags
-    async def mock_query_selector_all(selector):
-        if selector == ".promo-tag":
-            tag1 = AsyncMock()
-            tag1.text_content = AsyncMock(return_value="Nu met voordeel")
-            tag2 = AsyncMock()
-            tag2.text_content = AsyncMock(return_value="Actie")
-            return [tag1, tag2]
-        return []
-    
-    element.query_selector_all = mock_query_selector_all
-    
-    return element
+def offer_card():
+    """Create the raw contents of an offer card as read from the page."""
+    return {
+        "titles": [None, "Volkswagen Golf", None, None, None, None],
+        "prices": [None, "€389,00", None, None, None],
+        "text": (
+            "Volkswagen Golf Comfort Line 1.5 TSI €389,00 p/m "
+            "48 maanden, 10.000 km per jaar Levertijd: 2-3 maanden. Nu met voordeel Actie"
+        ),
+        "image_url": "https://example.com/car.jpg",
+        "source_url": "https://www.anwb.nl/auto/private-lease",
+    }
 
 
-@pytest.mark.asyncio
-async def test_extract_offer_data(mock_offer_element):
-    """Test extracting offer data from an element."""
-    # Initialize scraper
+def test_build_offers(offer_card):
+    """Test building an offer from raw card contents."""
     scraper = ANWBPrivateLeaseScraper()
     
-    # Mock page
-    mock_page = AsyncMock()
-    
-    # Extract offer data
-    offer = await scraper._extract_offer_data(mock_page, mock_offer_element)
+    scraped_at = datetime.now(timezone.utc)
+    offers = scraper._build_offers([offer_card], scraped_at)
     
     # Assertions
-    assert offer is not None
+    assert len(offers) == 1
+    offer = offers[0]
     assert isinstance(offer, LeaseOffer)
     assert offer.car_make == "Volkswagen"
     assert offer.car_model == "Golf"
-    assert offer.version == "Comfort Line 1.5 TSI"
+    assert offer.version == "1.5 TSI"
     assert offer.monthly_price == 389.0
     assert offer.lease_term_months == 48
     assert offer.kilometers_per_year == 10000
-    assert offer.delivery_time == "Levertijd: 2-3 maanden"
+    assert offer.delivery_time == "2-3 maanden"
     assert len(offer.promotional_tags) == 2
     assert "Nu met voordeel" in offer.promotional_tags
-    assert offer.image_url == "https://example.com/car.jpg"
+    assert str(offer.image_url) == "https://example.com/car.jpg"
     assert offer.provider == "anwb"
+    assert offer.scrape_timestamp == scraped_at
+
+
+async def test_read_offer_cards_single_evaluate():
+    """Test that all offer cards are read with a single page script."""
+    scraper = ANWBPrivateLeaseScraper()
+    
+    mock_page = AsyncMock()
+    mock_page.url = "https://www.anwb.nl/auto/private-lease"
+    mock_page.evaluate = AsyncMock(return_value=[{"text": "a"}, {"text": "b"}])
+    
+    cards = await scraper._read_offer_cards(mock_page, [MagicMock(), MagicMock()])
+    
+    assert mock_page.evaluate.await_count == 1
+    assert [card["source_url"] for card in cards] == [mock_page.url] * 2
+
+
+async def test_find_car_elements_single_script():
+    """Test that car elements are found with one page script and its handle is disposed."""
+    scraper = ANWBPrivateLeaseScraper()
+    
+    card_elements = [MagicMock(), MagicMock()]
+    matches = AsyncMock()
+    matches.get_properties.return_value = {
+        str(i): MagicMock(as_element=MagicMock(return_value=element))
+        for i, element in enumerate(card_elements)
+    }
+    page = AsyncMock()
+    page.evaluate_handle.return_value = matches
+    
+    elements = await scraper._find_car_elements(page)
+    
+    assert elements == card_elements
+    assert page.evaluate_handle.await_count == 1
+    page.query_selector_all.assert_not_called()
+    matches.dispose.assert_awaited_once()
+
+
+async def test_navigate_to_car_listings_falls_back_in_priority_order():
+    """Test that listing links are tried in priority order until one navigates."""
+    scraper = ANWBPrivateLeaseScraper()
+    scraper._wait_for_car_cards = AsyncMock()
+    
+    page = AsyncMock()
+    page.url = "https://www.anwb.nl/auto/private-lease"
+    clicked = []
+    
+    def locator(selector):
+        link = AsyncMock()
+        # Only "Aanbod" (second choice) and "Zoeken" (a later one) are on the page
+        link.count.return_value = int("'Aanbod'" in selector or "'Zoeken'" in selector)
+        
+        async def click():
+            clicked.append(selector)
+            if "'Zoeken'" in selector:
+                page.url = "https://www.anwb.nl/auto/private-lease/zoeken"
+        
+        link.click.side_effect = click
+        return MagicMock(first=link)
+    
+    page.locator = MagicMock(side_effect=locator)
+    
+    await scraper._navigate_to_car_listings(page)
+    
+    # "Aanbod" is tried first but doesn't navigate, so "Zoeken" is tried next
+    assert ["'Aanbod'" in selector for selector in clicked] == [True, False]
+    assert page.url.endswith("/zoeken")
+
+
+async def test_handle_cookie_consent_waits_for_banner():
+    """Test that a consent banner rendered after load is waited for and clicked."""
+    scraper = ANWBPrivateLeaseScraper()
+    
+    consent_button = AsyncMock()
+    page = AsyncMock()
+    page.locator = MagicMock(return_value=MagicMock(first=consent_button))
+    
+    await scraper._handle_cookie_consent(page)
+    
+    consent_button.wait_for.assert_awaited_once()
+    consent_button.click.assert_awaited_once()
+    
+    # No banner within the timeout: nothing to click
+    consent_button.reset_mock()
+    consent_button.wait_for.side_effect = PlaywrightTimeoutError("no banner")
+    
+    await scraper._handle_cookie_consent(page)
+    
+    consent_button.click.assert_not_awaited()
 
 
-@pytest.mark.asyncio
 async def test_parse_car_make_model():
     """Test parsing car make and model from title."""
     scraper = ANWBPrivateLeaseScraper()
@@ -113,32 +164,6 @@ async def test_parse_car_make_model():
         assert model == expected_model
 
 
-@pytest.mark.asyncio
-async def test_extract_lease_terms():
-    """Test extracting lease terms from element."""
-    scraper = ANWBPrivateLeaseScraper()
-    
-    # Test with valid element
-    element = AsyncMock()
-    element.text_content = AsyncMock(return_value="60 maanden, 15.000 km per jaar")
-    
-    months, kilometers = await scraper._extract_lease_terms(element)
-    assert months == 60
-    assert kilometers == 15000
-    
-    # Test with different format
-    element.text_content = AsyncMock(return_value="36 maanden, 20.000 km")
-    months, kilometers = await scraper._extract_lease_terms(element)
-    assert months == 36
-    assert kilometers == 20000
-    
-    # Test with None element (should return defaults)
-    months, kilometers = await scraper._extract_lease_terms(None)
-    assert months == 48
-    assert kilometers == 10000
-
-
-@pytest.mark.asyncio
 async def test_has_next_page():
     """Test checking for next page."""
     scraper = ANWBPrivateLeaseScraper()
@@ -147,7 +172,7 @@ async def test_has_next_page():
     page = AsyncMock()
     
     # Test with next page available
-    page.query_selector.return_value = AsyncMock()  # Non-None return
+    page.query_selector.return_value = MagicMock()  # Non-None return
     has_next = await scraper.has_next_page(page)
     assert has_next is True
     
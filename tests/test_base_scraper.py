@@ -0,0 +1,157 @@
+"""
+Base Scraper Tests
+
+Tests for the shared scraping flow in BaseScraper.
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock
+
+from car_lease_scraper.core.base_scraper import BaseScraper
+
+
+class DummyScraper(BaseScraper):
+    """Scraper with URL-addressable pages for testing."""
+
+    provider_name = "dummy"
+    base_url = "https://example.com/lease"
+
+    def page_urls(self):
+        return [f"{self.base_url}?page={i}" for i in range(1, 5)]
+
+    async def extract_offers(self, page, scraped_at):
+        # Finish later pages first to check that ordering is preserved
+        await asyncio.sleep(0.01 * (5 - int(page.url[-1])))
+        return [f"offer-{page.url[-1]}"]
+
+
+def mock_browser(scraper):
+    """Replace the scraper's browser with mock pages."""
+    @asynccontextmanager
+    async def pooled_page():
+        yield AsyncMock()
+
+    async def navigate(url, page=None):
+        page.url = url
+        return page
+
+    scraper.browser_manager.page = pooled_page
+    scraper.navigate_to_page = AsyncMock(side_effect=navigate)
+
+
+async def test_scrape_preserves_page_order():
+    """Test that concurrently scraped pages are returned in page order."""
+    scraper = DummyScraper(max_pages=3)
+    mock_browser(scraper)
+
+    offers = [offer async for offer in scraper.scrape()]
+
+    assert offers == ["offer-1", "offer-2", "offer-3"]
+    assert scraper.navigate_to_page.await_count == 3
+
+
+async def test_scrape_respects_max_concurrency():
+    """Test that no more than max_concurrency pages are scraped at once."""
+    scraper = DummyScraper(max_pages=4, max_concurrency=2)
+    scraper.stagger_ms = 0
+    mock_browser(scraper)
+
+    active = 0
+    peak = 0
+
+    async def tracked_extract(page, scraped_at):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        return []
+
+    scraper.extract_offers = tracked_extract
+    async for _ in scraper.scrape():
+        pass
+
+    assert peak == 2
+
+
+def test_navigation_respects_per_host_concurrency():
+    """Test that no more than per_host_concurrency navigations to a host run at once."""
+    scraper = DummyScraper(max_pages=4, max_concurrency=4)
+    scraper.per_host_concurrency = 2
+    scraper.stagger_ms = 0
+
+    @asynccontextmanager
+    async def pooled_page():
+        yield AsyncMock()
+
+    active = 0
+    peak = 0
+
+    async def tracked_navigate(url, page=None, **kwargs):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        page.url = url
+        return page
+
+    scraper.browser_manager.page = pooled_page
+    scraper.browser_manager.navigate_to_page = tracked_navigate
+
+    async def scrape():
+        return [offer async for offer in scraper.scrape()]
+
+    # Each run gets its own limits, so a second event loop works as well
+    for _ in range(2):
+        peak = 0
+        assert asyncio.run(scrape()) == ["offer-1", "offer-2", "offer-3", "offer-4"]
+        assert peak == 2
+
+
+async def test_run_in_parser_after_teardown():
+    """Test that a scraper can parse again after it has been torn down and reused."""
+    scraper = DummyScraper()
+    scraper.browser_manager.setup = AsyncMock()
+    scraper.browser_manager.teardown = AsyncMock()
+
+    for _ in range(2):
+        async with scraper:
+            assert await scraper.run_in_parser(sum, [1, 2, 3]) == 6
+
+
+async def test_scrape_staggers_only_first_wave(monkeypatch):
+    """Test that only the first max_concurrency workers are staggered."""
+    scraper = DummyScraper(max_pages=4, max_concurrency=2)
+    scraper.stagger_ms = 1000
+    mock_browser(scraper)
+
+    real_sleep = asyncio.sleep
+    staggers = []
+
+    async def recording_sleep(delay):
+        # Record stagger delays without waiting; the dummy pages sleep far less
+        if delay >= 1:
+            staggers.append(delay)
+            return
+        await real_sleep(delay)
+
+    monkeypatch.setattr(asyncio, "sleep", recording_sleep)
+    offers = [offer async for offer in scraper.scrape()]
+
+    assert offers == ["offer-1", "offer-2", "offer-3", "offer-4"]
+    assert staggers == [1.0]
+
+
+async def test_save_debug_snapshot_uses_output_dir(tmp_path):
+    """Test that debug snapshots go to the scraper's output directory."""
+    scraper = DummyScraper(debug=True, output_dir=tmp_path)
+    page = AsyncMock()
+    page.content.return_value = "<html></html>"
+
+    await scraper.save_debug_snapshot(page, "page", html=True)
+
+    page.screenshot.assert_awaited_once_with(path=f"{tmp_path / 'debug' / 'dummy_page'}.png")
+    assert (tmp_path / "debug" / "dummy_page.html").read_text(encoding="utf-8") == "<html></html>"
+
@@ -0,0 +1,30 @@
+"""
+Logging Utility Tests
+
+Tests for the logging helpers.
+"""
+
+import logging
+
+from car_lease_scraper.utils.logging import get_logger
+
+
+def test_get_logger_applies_level_on_every_call():
+    """Test that a cached logger still switches to the requested level."""
+    assert get_logger("level_test", "INFO").level == logging.INFO
+    assert get_logger("level_test", "DEBUG").level == logging.DEBUG
+    
+    logger = get_logger("level_test", "INFO")
+    assert logger.level == logging.INFO
+    assert len(logger.handlers) == 1
+
+
+def test_rich_console_writes_to_stderr(monkeypatch):
+    """Test that Rich log output goes to the stream that was checked for a terminal."""
+    from car_lease_scraper.utils import logging as logging_utils
+    
+    monkeypatch.setattr(logging_utils, "_console", None)
+    monkeypatch.setattr(logging_utils.sys.stderr, "isatty", lambda: True, raising=False)
+    
+    handler = logging_utils._console_handler()
+    assert handler.console.stderr
\ No newline at end of file
@@ -0,0 +1,57 @@
+"""
+Parsing Utility Tests
+
+Tests for the text parsing helpers.
+"""
+
+from car_lease_scraper.utils.parsing import clean_text, extract_number, extract_price, normalize_make_model, parse_lease_terms
+
+
+def test_clean_text():
+    """Test whitespace normalization in clean_text."""
+    assert clean_text("  Volkswagen \n\t Golf  ") == "Volkswagen Golf"
+    assert clean_text("Levertijd:\xa02-3\xa0 maanden") == "Levertijd: 2-3 maanden"
+    assert clean_text("   ") is None
+    assert clean_text("") is None
+    assert clean_text(None) is None
+
+
+def test_extract_price():
+    """Test price extraction for Dutch and English number formats."""
+    assert extract_price("€389,00 p/m") == 389.0
+    assert extract_price("€ 1.234,56") == 1234.56
+    assert extract_price("€ 1,234.56") == 1234.56
+    assert extract_price("vanaf € 415,- per maand") == 415.0
+    assert extract_price("€ 299") == 299.0
+    assert extract_price("op aanvraag") == 0.0
+    assert extract_price(None) == 0.0
+
+
+def test_extract_number():
+    """Test that only the first number in the text is extracted."""
+    assert extract_number("10.000 km per jaar") == 10000
+    assert extract_number("48 maanden, 10.000 km") == 48
+    assert extract_number("geen") is None
+    assert extract_number(None) is None
+
+
+def test_parse_lease_terms():
+    """Test extracting lease terms from text."""
+    assert parse_lease_terms("60 maanden, 15.000 km per jaar") == (60, 15000)
+    assert parse_lease_terms("36 maanden, 20.000 km") == (36, 20000)
+    
+    # Missing terms fall back to the defaults
+    assert parse_lease_terms(None) == (48, 10000)
+    assert parse_lease_terms("Op aanvraag") == (48, 10000)
+    
+    # A long digit run without a second number must not backtrack
+    assert parse_lease_terms("1" * 100000 + " maanden") == (48, 10000)
+
+
+def test_normalize_make_model():
+    """Test make corrections in normalize_make_model."""
+    assert normalize_make_model("vw", "Golf") == ("Volkswagen", "Golf")
+    assert normalize_make_model("BMW", "3 Serie") == ("BMW", "3 Serie")
+    assert normalize_make_model("mercedes benz", "A-Klasse") == ("Mercedes-Benz", "A-Klasse")
+    assert normalize_make_model("toyota", "Yaris") == ("Toyota", "Yaris")
+    assert normalize_make_model("vw", "Polo").make == "Volkswagen"
\ No newline at end of file
@@ -8,6 +8,8 @@ import json
 import pytest
 from pathlib import Path
 
+from pydantic import ValidationError
+
 from car_lease_scraper.models.lease_offer import LeaseOffer
 from car_lease_scraper.pipeline.processor import DataProcessor, ProcessedData
 
@@ -15,15 +17,15 @@ from car_lease_scraper.pipeline.processor import DataProcessor, ProcessedData
 @pytest.fixture
 def sample_offers(sample_lease_offer_data):
     """Create sample lease offers for testing."""
-    # Create 5 offers with slight variations
-    offers = []
-    for i in range(5):
-        data = sample_lease_offer_data.copy()
-        data["monthly_price"] += i * 10  # Increment price
-        data["car_model"] = f"{data['car_model']} {i+1}" if i > 0 else data["car_model"]
-        offers.append(LeaseOffer(**data))
-    
-    return offers
+    # Validate one offer and copy it with slight variations
+    base = LeaseOffer(**sample_lease_offer_data)
+    return [
+        base.model_copy(update={
+            "monthly_price": base.monthly_price + i * 10,  # Increment price
+            "car_model": f"{base.car_model} {i+1}" if i > 0 else base.car_model,
+        })
+        for i in range(5)
+    ]
 
 
 def test_data_processor_initialization():
@@ -43,21 +45,15 @@ def test_data_processor_initialization():
         custom_dir.rmdir()
 
 
-def test_process_validates_offers(sample_offers):
-    """Test that processing validates offers."""
-    processor = DataProcessor()
+def test_process_keeps_validated_offers(sample_offers, sample_lease_offer_data):
+    """Test that offers are validated when built and processed as they are."""
+    # Invalid offers are rejected on construction, so they never reach the processor
+    with pytest.raises(ValidationError):
+        LeaseOffer(**{**sample_lease_offer_data, "monthly_price": -100})
     
-    # Add an invalid offer (negative price)
-    invalid_offer = sample_offers[0].copy()
-    invalid_offer.monthly_price = -100
-    
-    # Process will filter out invalid offers during validation
-    # But since we're using Pydantic, the invalid offer would be caught
-    # during creation, not at processing time
-    
-    # Let's test normal processing instead
+    processor = DataProcessor()
     processed_data = processor.process(sample_offers)
-    assert len(processed_data.offers) == len(sample_offers)
+    assert processed_data.offers == sample_offers
 
 
 def test_processed_data_to_dict_list(sample_offers):
@@ -115,6 +111,23 @@ def test_save_to_csv(sample_offers, test_output_dir):
     # but for this example, we'll just check the file exists
 
 
+def test_save_to_parquet(sample_offers, test_output_dir):
+    """Test saving processed data to Parquet."""
+    pd = pytest.importorskip("pandas")
+    pytest.importorskip("pyarrow")
+    
+    processor = DataProcessor(output_dir=test_output_dir)
+    processed_data = processor.process(sample_offers)
+    
+    filepath = processed_data.save_to_parquet("test_offers.parquet")
+    assert filepath.exists()
+    
+    df = pd.read_parquet(filepath)
+    assert len(df) == len(sample_offers)
+    assert df["monthly_price"].tolist() == [offer.monthly_price for offer in sample_offers]
+    assert pd.api.types.is_datetime64_any_dtype(df["scrape_timestamp"])
+
+
 def test_get_summary(sample_offers):
     """Test getting a summary of processed data."""
     processor = DataProcessor()
@@ -125,4 +138,25 @@ def test_get_summary(sample_offers):
     assert "price_range" in summary
     assert summary["price_range"]["min"] == 389.0  # Base price from sample data
     assert "top_makes" in summary
-    assert "Volkswagen" in summary["top_makes"]
\ No newline at end of file
+    assert "Volkswagen" in summary["top_makes"]
+
+
+def test_jsonl_writer_streams_offers(sample_offers, test_output_dir):
+    """Test streaming offers to a JSON Lines file."""
+    processor = DataProcessor(output_dir=test_output_dir)
+    
+    # A rerun with the same filename replaces the earlier file
+    for _ in range(2):
+        with processor.open_jsonl_writer("test_offers.jsonl") as writer:
+            for offer in sample_offers:
+                writer.write(offer)
+    
+    filepath = writer.filepath
+    assert writer.count == len(sample_offers)
+    
+    with open(filepath, 'r', encoding='utf-8') as f:
+        lines = [json.loads(line) for line in f]
+    
+    assert len(lines) == len(sample_offers)
+    assert lines[0]["car_make"] == sample_offers[0].car_make
+    assert lines[-1]["monthly_price"] == sample_offers[-1].monthly_price
@@ -0,0 +1,39 @@
+"""
+Scraper Registry Tests
+
+Tests for scraper discovery in the registry.
+"""
+
+from unittest.mock import patch
+
+from car_lease_scraper.scrapers.registry import ScraperRegistry
+
+
+def test_discover_scrapers_finds_anwb():
+    """Test that scrapers are discovered from the modules in the package."""
+    registry = ScraperRegistry()
+    registry.discover_scrapers()
+    
+    assert "anwb" in registry.list_providers()
+
+
+def test_discover_scrapers_runs_once():
+    """Test that repeated discovery does not re-import the scraper modules."""
+    registry = ScraperRegistry()
+    registry.discover_scrapers()
+    
+    with patch("car_lease_scraper.scrapers.registry.importlib.import_module") as import_module:
+        registry.discover_scrapers()
+    
+    import_module.assert_not_called()
+
+
+def test_register_is_idempotent():
+    """Test that registering a class twice keeps a single entry."""
+    from car_lease_scraper.scrapers.anwb_scraper import ANWBPrivateLeaseScraper
+    
+    registry = ScraperRegistry()
+    registry.register(ANWBPrivateLeaseScraper)
+    registry.register(ANWBPrivateLeaseScraper)
+    
+    assert registry.list_providers() == ["anwb"]